@@ -18,6 +18,24 @@ from dataclasses import dataclass
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Indexes on the columns the dashboard filters by; built after the bulk insert
+# so rows are not indexed one at a time while loading
+DASHBOARD_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_hotspots_prov_prio ON crime_hotspots(province, sentinel_priority)",
+    "CREATE INDEX IF NOT EXISTS idx_hotspots_crime_type ON crime_hotspots(crime_type)",
+    "CREATE INDEX IF NOT EXISTS idx_vehicles_anpr_priority ON vehicle_crime_patterns(anpr_priority)",
+    "CREATE INDEX IF NOT EXISTS idx_deployments_priority ON sentinel_deployments(priority)",
+    "CREATE INDEX IF NOT EXISTS idx_cit_routes_risk_level ON cit_routes(risk_level)",
+    "CREATE INDEX IF NOT EXISTS idx_vehicles_theft ON vehicle_crime_patterns(crime_type, theft_count DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_vehicles_hijacking ON vehicle_crime_patterns(crime_type, hijacking_count DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_partners_officers ON private_security_partners(officer_count DESC)"
+)
+
+def create_dashboard_indexes(conn: sqlite3.Connection):
+    """Create the dashboard filter indexes in the connection's current transaction"""
+    for statement in DASHBOARD_INDEXES:
+        conn.execute(statement)
+
 @dataclass
 class CrimeHotspot:
     """Data class for crime hotspots"""
@@ -60,6 +78,8 @@ class SentinelDataIntegrator:
         logger.info("Setting up integrated database...")
         
         conn = sqlite3.connect(self.db_path)
+        # WAL lets dashboard sessions keep reading while the pipeline writes
+        conn.execute("PRAGMA journal_mode=WAL")
         cursor = conn.cursor()
         
         # Create tables
@@ -583,6 +603,9 @@ class SentinelDataIntegrator:
                 deployment["status"]
             ))
         
+        # Index once the tables are populated, in the same transaction
+        create_dashboard_indexes(conn)
+        
         conn.commit()
         conn.close()
         logger.info("Data insertion completed")
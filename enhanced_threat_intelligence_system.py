@@ -24,6 +24,18 @@ import yaml
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _to_jsonable(obj):
+    """Convert datetimes and paths to strings in one pass so json.dump needs no default hook"""
+    if isinstance(obj, dict):
+        return {key: _to_jsonable(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_jsonable(value) for value in obj]
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Path):
+        return str(obj)
+    return obj
+
 class SentinelEnhancedThreatIntelligence:
     def __init__(self, data_dir: str = "real_data"):
         self.data_dir = Path(data_dir)
@@ -834,7 +846,7 @@ echo "3. Access the integrated dashboard at http://localhost:3000"
         
         summary_file = self.data_dir / "enhanced_threat_intelligence_summary.json"
         with open(summary_file, 'w') as f:
-            json.dump(integration_summary, f, indent=2, default=str)
+            json.dump(_to_jsonable(integration_summary), f, indent=2)
         
         logger.info("Integration summary created successfully")
         return integration_summary
@@ -2,52 +2,139 @@
 """
 Firebase Integration for Sentinel Web Application
 Integrates with Firebase for authentication, database, and real-time features
+
+Required Firestore indexes (firestore.indexes.json, deploy with
+`firebase deploy --only firestore:indexes`):
+  - alerts: status ASC, visible_to CONTAINS, created_at DESC  (get_active_alerts by role)
+  - alerts: status ASC, created_at DESC                       (get_active_alerts for police)
+  - cases: assigned_to ASC, created_at DESC                   (get_cases_by_user)
+  - threat_events: created_at                                 (single-field, automatic)
+
+Migration: alerts stored before visible_to existed are hidden from the
+private_security, insurance and bank views until backfilled once with
+`SENTINEL_BACKFILL_ALERTS=1 python firebase_integration.py`.
+
+Index exemptions: threat_events.raw_data and threat_events.categories are
+never queried, so their automatic single-field indexes are disabled.
 """
 
 import firebase_admin
-from firebase_admin import credentials, firestore, auth
+from firebase_admin import credentials, firestore, firestore_async, auth
+from google.api_core import exceptions as google_exceptions
+from google.api_core import retry as google_retry
+from google.cloud.firestore_v1.bulk_writer import BulkWriterOptions
+import asyncio
+import functools
 import json
 import os
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Firestore caps a single WriteBatch at 500 operations
+BATCH_SIZE = 500
+
+# Starting BulkWriter throughput for seed data (ops/second)
+SEED_OPS_PER_SECOND = 500
+
+# Retry batch commits that lose a contention race instead of dropping them
+WRITE_RETRY = google_retry.Retry(
+    predicate=google_retry.if_exception_type(google_exceptions.Aborted)
+)
+
+# Threat event fields read by the dashboards; raw_data and friends stay server-side
+THREAT_EVENT_FIELDS = [
+    'event_id', 'ip_address', 'threat_type', 'severity_score', 'source',
+    'latitude', 'longitude', 'city', 'created_at'
+]
+
+# Alert types each non-police role may see (police see every alert)
+ROLE_ALERT_TYPES = {
+    'private_security': ['security', 'perimeter', 'suspicious'],
+    'insurance': ['fraud', 'claim', 'risk'],
+    'bank': ['fraud', 'transaction', 'account']
+}
+
+# Alert type -> roles, stored on each alert as visible_to
+ALERT_VISIBILITY = {
+    alert_type: [role for role, types in ROLE_ALERT_TYPES.items() if alert_type in types]
+    for types in ROLE_ALERT_TYPES.values()
+    for alert_type in types
+}
+
+# get_user_by_email cache bounds (seconds / entries)
+USER_CACHE_TTL = 300
+USER_CACHE_MAXSIZE = 10000
+
+# Minimum seconds between last_login writes for the same user
+LAST_LOGIN_DEBOUNCE = 300
+
+def _load_firebase_config():
+    """Build the service account configuration from environment variables"""
+    return {
+        "type": "service_account",
+        "project_id": os.getenv("FIREBASE_PROJECT_ID", "vigilo-fight-crime"),
+        "private_key_id": os.getenv("FIREBASE_PRIVATE_KEY_ID", ""),
+        "private_key": os.getenv("FIREBASE_PRIVATE_KEY", "").replace('\\n', '\n'),
+        "client_email": os.getenv("FIREBASE_CLIENT_EMAIL", ""),
+        "client_id": "115405211372157999404",
+        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+        "token_uri": "https://oauth2.googleapis.com/token",
+        "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
+        "client_x509_cert_url": "https://www.googleapis.com/robot/v1/metadata/x509/firebase-adminsdk-fbsvc%40vigilo-fight-crime.iam.gserviceaccount.com",
+        "universe_domain": "googleapis.com"
+    }
+
+@functools.lru_cache(maxsize=1)
+def _get_credential():
+    """Parse the service account certificate once per process"""
+    return credentials.Certificate(_load_firebase_config())
+
+@functools.lru_cache(maxsize=1)
+def get_firestore_client():
+    """Return the process-wide Firestore client, initializing the Admin SDK once"""
+    try:
+        firebase_admin.get_app()
+    except ValueError:
+        firebase_admin.initialize_app(_get_credential(), {
+            'projectId': 'vigilo-fight-crime'
+        })
+    
+    return firestore.client()
+
+@functools.lru_cache(maxsize=1)
+def get_firestore_write_client():
+    """Return a second Firestore client reserved for writes
+    
+    It has its own gRPC channel, so large batch commits do not queue
+    ahead of latency-sensitive dashboard reads on the read client.
+    """
+    app = firebase_admin.get_app()
+    
+    return firestore.Client(
+        project=app.project_id,
+        credentials=app.credential.get_credential()
+    )
+
 class FirebaseIntegration:
     def __init__(self):
-        self.cred = None
-        self.app = None
         self.db = None
+        self.write_db = None
         self.initialized = False
+        self._user_cache = OrderedDict()
+        self._last_login_writes = {}
         
     def initialize_firebase(self):
-        """Initialize Firebase with service account credentials"""
+        """Attach to the shared Firestore client"""
         try:
-            # Firebase service account configuration from environment variables
-            firebase_config = {
-                "type": "service_account",
-                "project_id": os.getenv("FIREBASE_PROJECT_ID", "vigilo-fight-crime"),
-                "private_key_id": os.getenv("FIREBASE_PRIVATE_KEY_ID", ""),
-                "private_key": os.getenv("FIREBASE_PRIVATE_KEY", "").replace('\\n', '\n'),
-                "client_email": os.getenv("FIREBASE_CLIENT_EMAIL", ""),
-                "client_id": "115405211372157999404",
-                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                "token_uri": "https://oauth2.googleapis.com/token",
-                "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
-                "client_x509_cert_url": "https://www.googleapis.com/robot/v1/metadata/x509/firebase-adminsdk-fbsvc%40vigilo-fight-crime.iam.gserviceaccount.com",
-                "universe_domain": "googleapis.com"
-            }
-            
-            # Initialize Firebase Admin SDK
-            self.cred = credentials.Certificate(firebase_config)
-            self.app = firebase_admin.initialize_app(self.cred, {
-                'projectId': 'vigilo-fight-crime'
-            })
-            
-            # Initialize Firestore
-            self.db = firestore.client()
+            # All instances share one read client and one write client
+            self.db = get_firestore_client()
+            self.write_db = get_firestore_write_client()
             
             self.initialized = True
             logger.info("Firebase initialized successfully")
@@ -77,12 +164,13 @@ class FirebaseIntegration:
                 'email': email,
                 'display_name': display_name,
                 'role': role,
-                'created_at': datetime.now(),
+                'created_at': firestore.SERVER_TIMESTAMP,
                 'last_login': None,
                 'active': True
             }
             
-            self.db.collection('users').document(user.uid).set(user_doc)
+            self.write_db.collection('users').document(user.uid).set(user_doc)
+            self._invalidate_user_cache(email=email)
             
             logger.info(f"User created successfully: {email}")
             return user
@@ -91,17 +179,46 @@ class FirebaseIntegration:
             logger.error(f"Failed to create user: {e}")
             return None
     
+    def _invalidate_user_cache(self, email=None, uid=None):
+        """Drop cached user lookups for an email or uid"""
+        if email is not None:
+            self._user_cache.pop(email, None)
+        if uid is not None:
+            for cached_email, (_, user) in list(self._user_cache.items()):
+                if user.get('uid') == uid:
+                    self._user_cache.pop(cached_email, None)
+    
+    def _cache_user(self, email, user):
+        """Cache a user lookup, evicting expired entries and then the oldest when full"""
+        now = time.monotonic()
+        self._user_cache.pop(email, None)
+        
+        # Every entry has the same TTL, so insertion order is expiry order
+        while self._user_cache and next(iter(self._user_cache.values()))[0] <= now:
+            self._user_cache.popitem(last=False)
+        if len(self._user_cache) >= USER_CACHE_MAXSIZE:
+            self._user_cache.popitem(last=False)
+        
+        self._user_cache[email] = (now + USER_CACHE_TTL, user)
+    
     def get_user_by_email(self, email):
         """Get user by email"""
         try:
             if not self.initialized:
                 return None
+            
+            # Serve warm users from the TTL cache
+            cached = self._user_cache.get(email)
+            if cached and cached[0] > time.monotonic():
+                return dict(cached[1])
                 
             # Get user from Firestore
             users = self.db.collection('users').where('email', '==', email).limit(1).get()
             
             if users:
-                return users[0].to_dict()
+                user = users[0].to_dict()
+                self._cache_user(email, user)
+                return dict(user)
             return None
             
         except Exception as e:
@@ -113,10 +230,18 @@ class FirebaseIntegration:
         try:
             if not self.initialized:
                 return False
+            
+            # Debounce: at most one last_login write per uid per window
+            now = time.monotonic()
+            last_write = self._last_login_writes.get(uid)
+            if last_write is not None and now - last_write < LAST_LOGIN_DEBOUNCE:
+                return True
                 
-            self.db.collection('users').document(uid).update({
-                'last_login': datetime.now()
+            self.write_db.collection('users').document(uid).update({
+                'last_login': firestore.SERVER_TIMESTAMP
             })
+            self._last_login_writes[uid] = now
+            self._invalidate_user_cache(uid=uid)
             
             return True
             
@@ -124,35 +249,53 @@ class FirebaseIntegration:
             logger.error(f"Failed to update last login: {e}")
             return False
     
+    def _build_threat_event_doc(self, event_data):
+        """Build the Firestore document for a threat event"""
+        return {
+            'event_id': event_data.get('event_id'),
+            'ip_address': event_data.get('ip_address'),
+            'threat_type': event_data.get('threat_type'),
+            'severity_score': event_data.get('severity_score'),
+            'confidence_score': event_data.get('confidence_score'),
+            'source': event_data.get('source'),
+            'country_code': event_data.get('country_code'),
+            'latitude': event_data.get('latitude'),
+            'longitude': event_data.get('longitude'),
+            'city': event_data.get('city'),
+            'region': event_data.get('region'),
+            'isp': event_data.get('isp'),
+            'asn': event_data.get('asn'),
+            'first_seen': event_data.get('first_seen'),
+            'last_seen': event_data.get('last_seen'),
+            'report_count': event_data.get('report_count', 0),
+            'categories': event_data.get('categories', []),
+            'raw_data': event_data.get('raw_data'),
+            'created_at': firestore.SERVER_TIMESTAMP
+        }
+    
+    def _commit_in_batches(self, writes):
+        """Commit (document_ref, doc) pairs in WriteBatch commits of up to BATCH_SIZE operations"""
+        for start in range(0, len(writes), BATCH_SIZE):
+            batch = self.write_db.batch()
+            for doc_ref, doc in writes[start:start + BATCH_SIZE]:
+                batch.set(doc_ref, doc)
+            batch.commit(retry=WRITE_RETRY)
+    
+    def _batch_write(self, collection_name, docs, id_field):
+        """Batch-write docs into a collection, keyed by their id_field value"""
+        collection = self.write_db.collection(collection_name)
+        
+        self._commit_in_batches([(collection.document(doc.get(id_field)), doc) for doc in docs])
+    
     def store_threat_event(self, event_data):
         """Store threat event in Firestore"""
         try:
             if not self.initialized:
                 return False
                 
-            event_doc = {
-                'event_id': event_data.get('event_id'),
-                'ip_address': event_data.get('ip_address'),
-                'threat_type': event_data.get('threat_type'),
-                'severity_score': event_data.get('severity_score'),
-                'confidence_score': event_data.get('confidence_score'),
-                'source': event_data.get('source'),
-                'country_code': event_data.get('country_code'),
-                'latitude': event_data.get('latitude'),
-                'longitude': event_data.get('longitude'),
-                'city': event_data.get('city'),
-                'region': event_data.get('region'),
-                'isp': event_data.get('isp'),
-                'asn': event_data.get('asn'),
-                'first_seen': event_data.get('first_seen'),
-                'last_seen': event_data.get('last_seen'),
-                'report_count': event_data.get('report_count', 0),
-                'categories': event_data.get('categories', []),
-                'raw_data': event_data.get('raw_data'),
-                'created_at': datetime.now()
-            }
+            event_doc = self._build_threat_event_doc(event_data)
             
-            self.db.collection('threat_events').add(event_doc)
+            self.write_db.collection('threat_events').document(event_doc['event_id']).set(event_doc)
             
             logger.info(f"Threat event stored: {event_data.get('event_id')}")
             return True
@@ -161,19 +304,39 @@ class FirebaseIntegration:
             logger.error(f"Failed to store threat event: {e}")
             return False
     
+    def store_threat_events_bulk(self, events):
+        """Store multiple threat events using batched writes"""
+        try:
+            if not self.initialized:
+                return False
+                
+            docs = [self._build_threat_event_doc(event_data) for event_data in events]
+            self._batch_write('threat_events', docs, 'event_id')
+            
+            logger.info(f"Threat events stored: {len(docs)}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to store threat events: {e}")
+            return False
+    
+    def _recent_threat_events_query(self, db, hours, limit):
+        """Build the recent threat events query, projected to the fields dashboards render"""
+        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+        
+        return db.collection('threat_events')\
+            .where('created_at', '>=', cutoff_time)\
+            .order_by('created_at', direction=firestore.Query.DESCENDING)\
+            .limit(limit)\
+            .select(THREAT_EVENT_FIELDS)
+    
     def get_recent_threat_events(self, hours=6, limit=100):
         """Get recent threat events"""
         try:
             if not self.initialized:
                 return []
-                
-            cutoff_time = datetime.now() - timedelta(hours=hours)
             
-            events = self.db.collection('threat_events')\
-                .where('created_at', '>=', cutoff_time)\
-                .order_by('created_at', direction=firestore.Query.DESCENDING)\
-                .limit(limit)\
-                .get()
+            events = self._recent_threat_events_query(self.db, hours, limit).stream()
             
             return [event.to_dict() for event in events]
             
@@ -181,25 +344,44 @@ class FirebaseIntegration:
             logger.error(f"Failed to get threat events: {e}")
             return []
     
+    async def get_recent_threat_events_async(self, hours=6, limit=100):
+        """Get recent threat events through the async client"""
+        try:
+            if not self.initialized:
+                return []
+            
+            query = self._recent_threat_events_query(firestore_async.client(), hours, limit)
+            
+            return [event.to_dict() async for event in query.stream()]
+            
+        except Exception as e:
+            logger.error(f"Failed to get threat events: {e}")
+            return []
+    
+    def _build_alert_doc(self, alert_data):
+        """Build the Firestore document for an alert"""
+        return {
+            'alert_id': alert_data.get('alert_id'),
+            'type': alert_data.get('type'),
+            'severity': alert_data.get('severity'),
+            'location': alert_data.get('location'),
+            'description': alert_data.get('description'),
+            'status': alert_data.get('status', 'active'),
+            'assigned_to': alert_data.get('assigned_to'),
+            'visible_to': ALERT_VISIBILITY.get((alert_data.get('type') or '').lower(), []),
+            'created_at': firestore.SERVER_TIMESTAMP,
+            'updated_at': firestore.SERVER_TIMESTAMP
+        }
+    
     def store_alert(self, alert_data):
         """Store alert in Firestore"""
         try:
             if not self.initialized:
                 return False
                 
-            alert_doc = {
-                'alert_id': alert_data.get('alert_id'),
-                'type': alert_data.get('type'),
-                'severity': alert_data.get('severity'),
-                'location': alert_data.get('location'),
-                'description': alert_data.get('description'),
-                'status': alert_data.get('status', 'active'),
-                'assigned_to': alert_data.get('assigned_to'),
-                'created_at': datetime.now(),
-                'updated_at': datetime.now()
-            }
+            alert_doc = self._build_alert_doc(alert_data)
             
-            self.db.collection('alerts').add(alert_doc)
+            self.write_db.collection('alerts').document(alert_doc['alert_id']).set(alert_doc)
             
             logger.info(f"Alert stored: {alert_data.get('alert_id')}")
             return True
@@ -208,6 +390,52 @@ class FirebaseIntegration:
             logger.error(f"Failed to store alert: {e}")
             return False
     
+    def store_alerts_bulk(self, alerts):
+        """Store multiple alerts using batched writes"""
+        try:
+            if not self.initialized:
+                return False
+                
+            docs = [self._build_alert_doc(alert_data) for alert_data in alerts]
+            self._batch_write('alerts', docs, 'alert_id')
+            
+            logger.info(f"Alerts stored: {len(docs)}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to store alerts: {e}")
+            return False
+    
+    def backfill_alert_visibility(self):
+        """Set visible_to on alerts written before it was stored
+        
+        get_active_alerts filters non-police roles on visible_to, so older
+        alerts without it stay hidden from those roles until this has run.
+        """
+        try:
+            if not self.initialized:
+                return False
+            
+            alerts = self.write_db.collection('alerts')
+            missing = [
+                alert for alert in self.db.collection('alerts').select(['type', 'visible_to']).stream()
+                if 'visible_to' not in alert.to_dict()
+            ]
+            
+            for start in range(0, len(missing), BATCH_SIZE):
+                batch = self.write_db.batch()
+                for alert in missing[start:start + BATCH_SIZE]:
+                    alert_type = (alert.to_dict().get('type') or '').lower()
+                    batch.update(alerts.document(alert.id), {'visible_to': ALERT_VISIBILITY.get(alert_type, [])})
+                batch.commit(retry=WRITE_RETRY)
+            
+            logger.info(f"Alert visibility backfilled: {len(missing)}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to backfill alert visibility: {e}")
+            return False
+    
     def get_active_alerts(self, user_role=None):
         """Get active alerts, optionally filtered by user role"""
         try:
@@ -216,19 +444,9 @@ class FirebaseIntegration:
                 
             query = self.db.collection('alerts').where('status', '==', 'active')
             
-            # Filter by role if specified
-            if user_role == 'police':
-                # Police can see all alerts
-                pass
-            elif user_role == 'private_security':
-                # Private security can see security-related alerts
-                query = query.where('type', 'in', ['security', 'perimeter', 'suspicious'])
-            elif user_role == 'insurance':
-                # Insurance can see fraud-related alerts
-                query = query.where('type', 'in', ['fraud', 'claim', 'risk'])
-            elif user_role == 'bank':
-                # Banks can see financial crime alerts
-                query = query.where('type', 'in', ['fraud', 'transaction', 'account'])
+            # Police can see all alerts; other roles read the denormalized visible_to list
+            if user_role in ROLE_ALERT_TYPES:
+                query = query.where('visible_to', 'array_contains', user_role)
             
             alerts = query.order_by('created_at', direction=firestore.Query.DESCENDING).get()
             
@@ -238,25 +456,29 @@ class FirebaseIntegration:
             logger.error(f"Failed to get alerts: {e}")
             return []
     
+    def _build_case_doc(self, case_data):
+        """Build the Firestore document for a case"""
+        return {
+            'case_id': case_data.get('case_id'),
+            'type': case_data.get('type'),
+            'status': case_data.get('status', 'open'),
+            'priority': case_data.get('priority', 'medium'),
+            'assigned_to': case_data.get('assigned_to'),
+            'description': case_data.get('description'),
+            'evidence_ids': case_data.get('evidence_ids', []),
+            'created_at': firestore.SERVER_TIMESTAMP,
+            'updated_at': firestore.SERVER_TIMESTAMP
+        }
+    
     def store_case(self, case_data):
         """Store case in Firestore"""
         try:
             if not self.initialized:
                 return False
                 
-            case_doc = {
-                'case_id': case_data.get('case_id'),
-                'type': case_data.get('type'),
-                'status': case_data.get('status', 'open'),
-                'priority': case_data.get('priority', 'medium'),
-                'assigned_to': case_data.get('assigned_to'),
-                'description': case_data.get('description'),
-                'evidence_ids': case_data.get('evidence_ids', []),
-                'created_at': datetime.now(),
-                'updated_at': datetime.now()
-            }
+            case_doc = self._build_case_doc(case_data)
             
-            self.db.collection('cases').add(case_doc)
+            self.write_db.collection('cases').document(case_doc['case_id']).set(case_doc)
             
             logger.info(f"Case stored: {case_data.get('case_id')}")
             return True
@@ -265,24 +487,77 @@ class FirebaseIntegration:
             logger.error(f"Failed to store case: {e}")
             return False
     
-    def get_cases_by_user(self, user_id, user_role):
-        """Get cases for a specific user based on their role"""
+    def store_cases_bulk(self, cases):
+        """Store multiple cases using batched writes"""
         try:
             if not self.initialized:
-                return []
+                return False
                 
-            if user_role == 'police':
-                # Police can see all cases
-                cases = self.db.collection('cases').get()
-            else:
-                # Other roles can only see cases assigned to them
-                cases = self.db.collection('cases').where('assigned_to', '==', user_id).get()
+            docs = [self._build_case_doc(case_data) for case_data in cases]
+            self._batch_write('cases', docs, 'case_id')
             
-            return [case.to_dict() for case in cases]
+            logger.info(f"Cases stored: {len(docs)}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to store cases: {e}")
+            return False
+    
+    def get_cases_by_user(self, user_id, user_role, page_size=100, cursor=None):
+        """Get one page of cases for a user based on their role
+        
+        Returns (cases, next_cursor); pass next_cursor back to fetch the
+        following page. next_cursor is None on the last page. The cursor is
+        the last page's DocumentSnapshot rather than its created_at: every
+        case in one batch commit shares the same server timestamp, and the
+        snapshot also pins the document id as a tiebreaker.
+        """
+        try:
+            if not self.initialized:
+                return [], None
+            
+            query = self.db.collection('cases')
+            
+            if user_role != 'police':
+                # Other roles can only see cases assigned to them; police see all
+                query = query.where('assigned_to', '==', user_id)
+            
+            query = query.order_by('created_at', direction=firestore.Query.DESCENDING).limit(page_size)
+            
+            if cursor is not None:
+                query = query.start_after(cursor)
+            
+            snapshots = list(query.stream())
+            next_cursor = snapshots[-1] if len(snapshots) == page_size else None
+            
+            return [case.to_dict() for case in snapshots], next_cursor
             
         except Exception as e:
             logger.error(f"Failed to get cases: {e}")
-            return []
+            return [], None
+    
+    def _build_evidence_doc(self, evidence_data):
+        """Build the Firestore document for an evidence item"""
+        return {
+            'evidence_id': evidence_data.get('evidence_id'),
+            'case_id': evidence_data.get('case_id'),
+            'type': evidence_data.get('type'),
+            'source': evidence_data.get('source'),
+            'content': evidence_data.get('content'),
+            'metadata': evidence_data.get('metadata'),
+            'confidence_score': evidence_data.get('confidence_score'),
+            'verification_status': evidence_data.get('verification_status', 'pending'),
+            'created_at': firestore.SERVER_TIMESTAMP
+        }
+    
+    def _evidence_ref(self, evidence_doc):
+        """Evidence lives under its case (cases/{case_id}/evidence) when one is set"""
+        if evidence_doc.get('case_id'):
+            collection = self.write_db.collection('cases').document(evidence_doc['case_id']).collection('evidence')
+        else:
+            collection = self.write_db.collection('evidence')
+        
+        return collection.document(evidence_doc.get('evidence_id'))
     
     def store_evidence(self, evidence_data):
         """Store evidence in Firestore"""
@@ -290,18 +565,9 @@ class FirebaseIntegration:
             if not self.initialized:
                 return False
                 
-            evidence_doc = {
-                'evidence_id': evidence_data.get('evidence_id'),
-                'type': evidence_data.get('type'),
-                'source': evidence_data.get('source'),
-                'content': evidence_data.get('content'),
-                'metadata': evidence_data.get('metadata'),
-                'confidence_score': evidence_data.get('confidence_score'),
-                'verification_status': evidence_data.get('verification_status', 'pending'),
-                'created_at': datetime.now()
-            }
+            evidence_doc = self._build_evidence_doc(evidence_data)
             
-            self.db.collection('evidence').add(evidence_doc)
+            self._evidence_ref(evidence_doc).set(evidence_doc)
             
             logger.info(f"Evidence stored: {evidence_data.get('evidence_id')}")
             return True
@@ -310,15 +576,29 @@ class FirebaseIntegration:
             logger.error(f"Failed to store evidence: {e}")
             return False
     
+    def store_evidence_bulk(self, evidence_items):
+        """Store multiple evidence items using batched writes"""
+        try:
+            if not self.initialized:
+                return False
+                
+            docs = [self._build_evidence_doc(evidence_data) for evidence_data in evidence_items]
+            self._commit_in_batches([(self._evidence_ref(doc), doc) for doc in docs])
+            
+            logger.info(f"Evidence items stored: {len(docs)}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to store evidence items: {e}")
+            return False
+    
     def get_evidence_by_case(self, case_id):
         """Get evidence for a specific case"""
         try:
             if not self.initialized:
                 return []
                 
-            evidence = self.db.collection('evidence')\
-                .where('case_id', '==', case_id)\
-                .get()
+            evidence = self.db.collection('cases').document(case_id).collection('evidence').get()
             
             return [doc.to_dict() for doc in evidence]
             
@@ -326,12 +606,37 @@ class FirebaseIntegration:
             logger.error(f"Failed to get evidence: {e}")
             return []
     
+    async def _setup_users(self, users):
+        """Create users concurrently; each Auth call is a blocking HTTPS round-trip"""
+        loop = asyncio.get_running_loop()
+        
+        return await asyncio.gather(*[
+            loop.run_in_executor(
+                None,
+                self.create_user,
+                user_data['email'],
+                user_data['password'],
+                user_data['display_name'],
+                user_data['role']
+            )
+            for user_data in users
+        ])
+    
     def setup_initial_data(self):
-        """Setup initial data in Firestore"""
+        """Setup initial data in Firestore
+        
+        Returns True when seeded, False on failure, and None when seeding
+        was skipped because SENTINEL_SEED is not set to 1.
+        """
         try:
             if not self.initialized:
                 return False
             
+            # Seeding is opt-in so production boots never re-seed
+            if os.getenv("SENTINEL_SEED") != "1":
+                logger.info("Skipping initial data setup; set SENTINEL_SEED=1 to seed")
+                return None
+            
             # Create sample users
             sample_users = [
                 {
@@ -360,14 +665,6 @@ class FirebaseIntegration:
                 }
             ]
             
-            for user_data in sample_users:
-                self.create_user(
-                    user_data['email'],
-                    user_data['password'],
-                    user_data['display_name'],
-                    user_data['role']
-                )
-            
             # Create sample threat events
             sample_threats = [
                 {
@@ -412,9 +709,6 @@ class FirebaseIntegration:
                 }
             ]
             
-            for threat_data in sample_threats:
-                self.store_threat_event(threat_data)
-            
             # Create sample alerts
             sample_alerts = [
                 {
@@ -446,8 +740,28 @@ class FirebaseIntegration:
                 }
             ]
             
-            for alert_data in sample_alerts:
-                self.store_alert(alert_data)
+            # Stream seed documents through a BulkWriter; it sends in the
+            # background while the Auth users are created
+            bulk_writer = self.write_db.bulk_writer(
+                options=BulkWriterOptions(initial_ops_per_second=SEED_OPS_PER_SECOND)
+            )
+            
+            # close() flushes the queued writes and stops the writer's executor,
+            # so it runs even when a set or the user setup raises
+            try:
+                threat_events = self.write_db.collection('threat_events')
+                for threat_data in sample_threats:
+                    event_doc = self._build_threat_event_doc(threat_data)
+                    bulk_writer.set(threat_events.document(event_doc['event_id']), event_doc)
+                
+                alerts = self.write_db.collection('alerts')
+                for alert_data in sample_alerts:
+                    alert_doc = self._build_alert_doc(alert_data)
+                    bulk_writer.set(alerts.document(alert_doc['alert_id']), alert_doc)
+                
+                asyncio.run(self._setup_users(sample_users))
+            finally:
+                bulk_writer.close()
             
             logger.info("Initial data setup completed")
             return True
@@ -462,8 +776,18 @@ if __name__ == "__main__":
     if firebase.initialize_firebase():
         print("✅ Firebase initialized successfully")
         
+        # One-off migration: alerts stored before visible_to existed
+        if os.getenv("SENTINEL_BACKFILL_ALERTS") == "1":
+            if firebase.backfill_alert_visibility():
+                print("✅ Alert visibility backfilled")
+            else:
+                print("❌ Failed to backfill alert visibility")
+        
         # Setup initial data
-        if firebase.setup_initial_data():
+        seeded = firebase.setup_initial_data()
+        if seeded is None:
+            print("⏭️ Initial data setup skipped (set SENTINEL_SEED=1)")
+        elif seeded:
             print("✅ Initial data setup completed")
         else:
             print("❌ Failed to setup initial data")
@@ -55,6 +55,16 @@ def install_requirements():
     
     print_info("Installing required packages...")
     
+    # One pip invocation resolves every package together
+    try:
+        subprocess.check_call([
+            sys.executable, "-m", "pip", "install", *requirements, "--quiet"
+        ])
+        print_status(f"Installed {', '.join(requirements)}")
+        return
+    except subprocess.CalledProcessError as e:
+        print_error(f"Combined install failed, retrying packages individually: {e}")
+    
     for package in requirements:
         try:
             subprocess.check_call([
@@ -2,568 +2,923 @@
 """
 Sentinel MVP Product Roadmap - Detailed Implementation
 Comprehensive milestone-based roadmap with timeline and resource planning
+
+Runs on the standard library plus NumPy (imported lazily); orjson is used
+for the JSON report when it is installed.
 """
 
-import json
-import pandas as pd
+import copy
+import csv
+import functools
+import importlib.util
+import itertools
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, fields
+from operator import attrgetter
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Dict, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional fast path; the stdlib encoder is used otherwise
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional; without it only the JSON report is written
+    msgpack = None
+
+@dataclass(frozen=True, slots=True)
+class Milestone:
+    """Data class for roadmap milestones"""
+    phase: str
+    milestone: str
+    start_week: int
+    duration_weeks: int
+    owner: str
+    dependencies: Tuple[str, ...]
+    deliverables: Tuple[str, ...]
+    success_criteria: Tuple[str, ...]
+    budget: int
+    risk_level: str
+    
+    def __post_init__(self):
+        # Low-cardinality columns share one string object per distinct value
+        for name in ("phase", "owner", "risk_level"):
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
+
+@dataclass(frozen=True, slots=True)
+class KeyMilestone:
+    """Data class for key timeline milestones"""
+    week: int
+    milestone: str
+    description: str
+    key_metrics: Tuple[str, ...]
+    deliverables: Tuple[str, ...]
+    budget_spent: int
+    roi_achieved: str
+
+@dataclass(frozen=True, slots=True)
+class PhaseResources:
+    """Data class for per-phase resource allocation"""
+    team_size: int
+    roles: Dict[str, int]
+    budget: int
+    duration_weeks: int
+    monthly_cost: int
+
+@dataclass(frozen=True, slots=True)
+class RiskEntry:
+    """Data class for risk mitigation entries"""
+    risk: str
+    probability: str
+    impact: str
+    mitigation: Tuple[str, ...]
+    contingency_budget: int
+
+def _record(fields):
+    """asdict factory that exports tuple fields as lists, matching the JSON/CSV layout"""
+    return {key: list(value) if isinstance(value, tuple) else value for key, value in fields}
+
+_ROADMAP = (
+    # Phase 0: Foundation & Pilot (Months 1-3)
+    Milestone(
+        phase="Phase 0",
+        milestone="Project Initiation",
+        start_week=1,
+        duration_weeks=2,
+        owner="PM",
+        dependencies=(),
+        deliverables=("Project charter", "Team assembly", "Stakeholder alignment"),
+        success_criteria=("Team hired", "Budget approved", "Stakeholders aligned"),
+        budget=500000,  # R500K
+        risk_level="Low"
+    ),
+    Milestone(
+        phase="Phase 0",
+        milestone="Stakeholder Partnerships",
+        start_week=3,
+        duration_weeks=4,
+        owner="BD",
+        dependencies=("Project Initiation",),
+        deliverables=("Private security MoUs", "Bank partnerships", "Insurance agreements"),
+        success_criteria=("3+ security partners", "2+ bank partnerships", "2+ insurance partners"),
+        budget=300000,  # R300K
+        risk_level="Medium"
+    ),
+    Milestone(
+        phase="Phase 0",
+        milestone="Technical Foundation",
+        start_week=1,
+        duration_weeks=8,
+        owner="Tech Lead",
+        dependencies=(),
+        deliverables=("Infrastructure setup", "Database design", "API framework"),
+        success_criteria=("Cloud infrastructure ready", "Database deployed", "API endpoints functional"),
+        budget=800000,  # R800K
+        risk_level="Medium"
+    ),
+    Milestone(
+        phase="Phase 0",
+        milestone="MVP ANPR System",
+        start_week=4,
+        duration_weeks=6,
+        owner="ML Engineer",
+        dependencies=("Technical Foundation",),
+        deliverables=("ANPR model training", "Edge deployment", "Real-time processing"),
+        success_criteria=("95%+ ANPR accuracy", "50ms inference time", "10+ edge devices deployed"),
+        budget=600000,  # R600K
+        risk_level="High"
+    ),
+    Milestone(
+        phase="Phase 0",
+        milestone="Mobile App MVP",
+        start_week=6,
+        duration_weeks=8,
+        owner="Mobile Dev",
+        dependencies=("Technical Foundation",),
+        deliverables=("Android app", "iOS app", "Citizen reporting features"),
+        success_criteria=("App store approval", "1000+ downloads", "50+ daily active users"),
+        budget=400000,  # R400K
+        risk_level="Medium"
+    ),
+    Milestone(
+        phase="Phase 0",
+        milestone="Pilot Deployment",
+        start_week=10,
+        duration_weeks=4,
+        owner="Ops Team",
+        dependencies=("MVP ANPR System", "Mobile App MVP", "Stakeholder Partnerships"),
+        deliverables=("Sandton CBD deployment", "User training", "Performance monitoring"),
+        success_criteria=("20+ edge devices active", "30% detection improvement", "User satisfaction >80%"),
+        budget=300000,  # R300K
+        risk_level="High"
+    ),
+    
+    # Phase 1: Core Development (Months 4-9)
+    Milestone(
+        phase="Phase 1",
+        milestone="Advanced ML Models",
+        start_week=14,
+        duration_weeks=12,
+        owner="ML Engineer",
+        dependencies=("Pilot Deployment",),
+        deliverables=("Gunshot detection", "Weapon detection", "Behavioral analysis"),
+        success_criteria=("90%+ gunshot accuracy", "85%+ weapon detection", "Real-time processing"),
+        budget=1200000,  # R1.2M
+        risk_level="High"
+    ),
+    Milestone(
+        phase="Phase 1",
+        milestone="Threat Intelligence Integration",
+        start_week=16,
+        duration_weeks=10,
+        owner="Security Engineer",
+        dependencies=("Technical Foundation",),
+        deliverables=("Cyber threat feeds", "OSINT integration", "Threat correlation"),
+        success_criteria=("5+ threat feeds integrated", "Real-time correlation", "Automated alerts"),
+        budget=800000,  # R800K
+        risk_level="Medium"
+    ),
+    Milestone(
+        phase="Phase 1",
+        milestone="Bank Integration",
+        start_week=18,
+        duration_weeks=8,
+        owner="Integration Engineer",
+        dependencies=("Stakeholder Partnerships",),
+        deliverables=("Fraud detection API", "Real-time alerts", "Cross-domain correlation"),
+        success_criteria=("2+ banks integrated", "Fraud detection working", "Response time <5min"),
+        budget=1000000,  # R1M
+        risk_level="High"
+    ),
+    Milestone(
+        phase="Phase 1",
+        milestone="Scale to 3 Cities",
+        start_week=20,
+        duration_weeks=16,
+        owner="Ops Team",
+        dependencies=("Advanced ML Models", "Threat Intelligence Integration"),
+        deliverables=("Cape Town deployment", "Durban deployment", "Performance optimization"),
+        success_criteria=("100+ edge devices", "3 cities active", "40% detection improvement"),
+        budget=2000000,  # R2M
+        risk_level="Medium"
+    ),
+    
+    # Phase 2: Scale & Integration (Months 10-21)
+    Milestone(
+        phase="Phase 2",
+        milestone="National Infrastructure",
+        start_week=36,
+        duration_weeks=20,
+        owner="Infrastructure Team",
+        dependencies=("Scale to 3 Cities",),
+        deliverables=("Multi-region deployment", "Load balancing", "Disaster recovery"),
+        success_criteria=("9 provinces covered", "99.9% uptime", "Auto-scaling working"),
+        budget=3000000,  # R3M
+        risk_level="Medium"
+    ),
+    Milestone(
+        phase="Phase 2",
+        milestone="Advanced Analytics",
+        start_week=40,
+        duration_weeks=16,
+        owner="Data Scientist",
+        dependencies=("National Infrastructure",),
+        deliverables=("Predictive analytics", "Crime forecasting", "Pattern recognition"),
+        success_criteria=("80%+ prediction accuracy", "Real-time forecasting", "Pattern detection"),
+        budget=1500000,  # R1.5M
+        risk_level="High"
+    ),
+    Milestone(
+        phase="Phase 2",
+        milestone="Law Enforcement Gateway",
+        start_week=44,
+        duration_weeks=12,
+        owner="Legal/Compliance",
+        dependencies=("Advanced Analytics",),
+        deliverables=("LE portal", "Audit trails", "Legal compliance"),
+        success_criteria=("Legal approval", "Audit compliance", "LE adoption"),
+        budget=2000000,  # R2M
+        risk_level="High"
+    ),
+    Milestone(
+        phase="Phase 2",
+        milestone="Full Ecosystem Integration",
+        start_week=48,
+        duration_weeks=20,
+        owner="Integration Team",
+        dependencies=("Law Enforcement Gateway",),
+        deliverables=("All banks integrated", "Insurance integration", "Government systems"),
+        success_criteria=("10+ banks", "5+ insurers", "Government approval"),
+        budget=3500000,  # R3.5M
+        risk_level="Medium"
+    ),
+    
+    # Phase 3: National Deployment (Months 22-30)
+    Milestone(
+        phase="Phase 3",
+        milestone="National Rollout",
+        start_week=68,
+        duration_weeks=24,
+        owner="Ops Team",
+        dependencies=("Full Ecosystem Integration",),
+        deliverables=("National deployment", "User training", "Support systems"),
+        success_criteria=("500+ edge devices", "50,000+ users", "45% crime reduction"),
+        budget=5000000,  # R5M
+        risk_level="Low"
+    )
+)
+
+_MILESTONES = (
+    KeyMilestone(
+        week=12,
+        milestone="Phase 0 Complete",
+        description="Pilot deployment in Sandton CBD",
+        key_metrics=("20+ edge devices", "30% detection improvement", "1000+ app users"),
+        deliverables=("MVP ANPR system", "Mobile app", "Basic dashboard"),
+        budget_spent=2900000,  # R2.9M
+        roi_achieved="30% detection improvement"
+    ),
+    KeyMilestone(
+        week=24,
+        milestone="Phase 1 Complete",
+        description="3 cities deployed with advanced features",
+        key_metrics=("100+ edge devices", "40% detection improvement", "10,000+ users"),
+        deliverables=("Gunshot detection", "Threat intelligence", "Bank integration"),
+        budget_spent=7900000,  # R7.9M
+        roi_achieved="40% detection improvement"
+    ),
+    KeyMilestone(
+        week=36,
+        milestone="Phase 2 Complete",
+        description="National infrastructure with full integration",
+        key_metrics=("300+ edge devices", "45% detection improvement", "25,000+ users"),
+        deliverables=("National infrastructure", "Advanced analytics", "LE gateway"),
+        budget_spent=14900000,  # R14.9M
+        roi_achieved="45% detection improvement"
+    ),
+    KeyMilestone(
+        week=48,
+        milestone="Full Ecosystem",
+        description="Complete integration with all partners",
+        key_metrics=("500+ edge devices", "50% detection improvement", "50,000+ users"),
+        deliverables=("All banks integrated", "Insurance integration", "Government systems"),
+        budget_spent=19900000,  # R19.9M
+        roi_achieved="50% detection improvement"
+    ),
+    KeyMilestone(
+        week=68,
+        milestone="National Deployment",
+        description="Full national rollout complete",
+        key_metrics=("1000+ edge devices", "55% detection improvement", "100,000+ users"),
+        deliverables=("National coverage", "Full ecosystem", "Operational excellence"),
+        budget_spent=24900000,  # R24.9M
+        roi_achieved="55% detection improvement"
+    )
+)
+
+_RESOURCES = {
+    "Phase 0": PhaseResources(
+        team_size=8,
+        roles={
+            "Product Manager": 1,
+            "Tech Lead": 1,
+            "ML Engineer": 1,
+            "Backend Developer": 2,
+            "Mobile Developer": 1,
+            "DevOps Engineer": 1,
+            "Business Development": 1
+        },
+        budget=2900000,  # R2.9M
+        duration_weeks=12,
+        monthly_cost=241667  # R241K/month
+    ),
+    "Phase 1": PhaseResources(
+        team_size=12,
+        roles={
+            "Product Manager": 1,
+            "Tech Lead": 1,
+            "ML Engineer": 2,
+            "Backend Developer": 3,
+            "Frontend Developer": 1,
+            "Mobile Developer": 1,
+            "DevOps Engineer": 1,
+            "Security Engineer": 1,
+            "Business Development": 1
+        },
+        budget=5000000,  # R5M
+        duration_weeks=24,
+        monthly_cost=208333  # R208K/month
+    ),
+    "Phase 2": PhaseResources(
+        team_size=18,
+        roles={
+            "Product Manager": 1,
+            "Tech Lead": 1,
+            "ML Engineer": 3,
+            "Backend Developer": 4,
+            "Frontend Developer": 2,
+            "Mobile Developer": 1,
+            "DevOps Engineer": 2,
+            "Security Engineer": 2,
+            "Data Scientist": 1,
+            "Legal/Compliance": 1
+        },
+        budget=10000000,  # R10M
+        duration_weeks=36,
+        monthly_cost=277778  # R278K/month
+    ),
+    "Phase 3": PhaseResources(
+        team_size=25,
+        roles={
+            "Product Manager": 2,
+            "Tech Lead": 2,
+            "ML Engineer": 4,
+            "Backend Developer": 6,
+            "Frontend Developer": 3,
+            "Mobile Developer": 2,
+            "DevOps Engineer": 3,
+            "Security Engineer": 2,
+            "Data Scientist": 2,
+            "Legal/Compliance": 1,
+            "Support Engineer": 2
+        },
+        budget=15000000,  # R15M
+        duration_weeks=24,
+        monthly_cost=625000  # R625K/month
+    )
+}
+
+_RISK_PLAN = {
+    "technical_risks": (
+        RiskEntry(
+            risk="ML model accuracy below target",
+            probability="Medium",
+            impact="High",
+            mitigation=(
+                "Extended training with augmented data",
+                "Multiple model ensemble approach",
+                "Continuous model improvement pipeline",
+                "Fallback to rule-based systems"
+            ),
+            contingency_budget=500000  # R500K
+        ),
+        RiskEntry(
+            risk="Edge device deployment challenges",
+            probability="High",
+            impact="Medium",
+            mitigation=(
+                "Pilot testing with multiple vendors",
+                "Vendor partnerships and support agreements",
+                "Modular hardware design",
+                "Remote device management system"
+            ),
+            contingency_budget=300000  # R300K
+        ),
+        RiskEntry(
+            risk="Integration complexity with legacy systems",
+            probability="Medium",
+            impact="High",
+            mitigation=(
+                "API-first design approach",
+                "Modular architecture with microservices",
+                "Comprehensive testing framework",
+                "Gradual integration rollout"
+            ),
+            contingency_budget=400000  # R400K
+        )
+    ),
+    "business_risks": (
+        RiskEntry(
+            risk="Partner adoption slower than expected",
+            probability="Medium",
+            impact="High",
+            mitigation=(
+                "Early engagement and value demonstration",
+                "Pilot programs with key partners",
+                "Flexible integration options",
+                "Strong ROI documentation"
+            ),
+            contingency_budget=200000  # R200K
+        ),
+        RiskEntry(
+            risk="Regulatory approval delays",
+            probability="Low",
+            impact="High",
+            mitigation=(
+                "Early legal consultation and compliance framework",
+                "Proactive engagement with regulators",
+                "Privacy by design implementation",
+                "Legal review of all data handling"
+            ),
+            contingency_budget=300000  # R300K
+        ),
+        RiskEntry(
+            risk="Competition from established players",
+            probability="Medium",
+            impact="Medium",
+            mitigation=(
+                "Unique value proposition development",
+                "First-mover advantage in South Africa",
+                "Strong intellectual property protection",
+                "Continuous innovation and improvement"
+            ),
+            contingency_budget=100000  # R100K
+        )
+    ),
+    "operational_risks": (
+        RiskEntry(
+            risk="Team scaling challenges",
+            probability="Medium",
+            impact="Medium",
+            mitigation=(
+                "Gradual hiring with knowledge transfer",
+                "Strong documentation and processes",
+                "Remote work capabilities",
+                "Partnership with local universities"
+            ),
+            contingency_budget=150000  # R150K
+        ),
+        RiskEntry(
+            risk="Infrastructure scaling issues",
+            probability="Low",
+            impact="High",
+            mitigation=(
+                "Cloud-native architecture with auto-scaling",
+                "Multi-region deployment strategy",
+                "Comprehensive monitoring and alerting",
+                "Disaster recovery and backup systems"
+            ),
+            contingency_budget=250000  # R250K
+        ),
+        RiskEntry(
+            risk="User adoption challenges",
+            probability="Medium",
+            impact="Medium",
+            mitigation=(
+                "User-centric design and testing",
+                "Comprehensive training programs",
+                "Strong customer support",
+                "Incentive programs for early adopters"
+            ),
+            contingency_budget=100000  # R100K
+        )
+    )
+}
+
+# Project schedule; the end date is fixed, so both ISO strings are built once
+_START_DATE = datetime(2025, 1, 1)
+_DURATION_WEEKS = 92
+_END_DATE = _START_DATE + timedelta(days=_DURATION_WEEKS * 7)
+_START_ISO = _START_DATE.isoformat()
+_END_ISO = _END_DATE.isoformat()
+
+# Invariant totals, computed once at import
+_TOTAL_BUDGET = sum(item.budget for item in _ROADMAP)
+_TOTAL_CONTINGENCY = sum(
+    risk.contingency_budget
+    for risks in _RISK_PLAN.values()
+    for risk in risks
+)
+
+def _phase_slices(items):
+    """Map each phase to the slice of contiguous records it covers"""
+    slices = {}
+    start = 0
+    
+    for phase, group in itertools.groupby(items, key=attrgetter("phase")):
+        if phase in slices:
+            raise ValueError(f"Roadmap records for {phase} are not contiguous")
+        end = start + sum(1 for _ in group)
+        slices[phase] = slice(start, end)
+        start = end
+    
+    return slices
+
+# Phase -> slice of _ROADMAP; the roadmap is kept grouped by phase
+_PHASE_SLICES = _phase_slices(_ROADMAP)
+
+# Distinct phases in roadmap order; a milestone's phase code is its position here
+_PHASE_NAMES = tuple(_PHASE_SLICES)
+
+@functools.lru_cache(maxsize=1)
+def _schedule_index():
+    """Milestone [start, end) week intervals sorted by start, for week lookups"""
+    import numpy as np
+    
+    columns = _roadmap_columns()
+    order = np.argsort(columns["start_week"], kind="stable")
+    starts = columns["start_week"][order]
+    ends = starts + columns["duration_weeks"][order]
+    
+    return order, starts, ends
+
+@functools.lru_cache(maxsize=1)
+def _resource_columns():
+    """Typed columns for the per-phase resource plan, in phase order"""
+    import numpy as np
+    
+    plans = list(_RESOURCES.values())
+    return {
+        "phase": np.array(list(_RESOURCES)),
+        "team_size": np.array([plan.team_size for plan in plans], dtype=np.int8),
+        "budget": np.array([plan.budget for plan in plans], dtype=np.int32),
+        "duration_weeks": np.array([plan.duration_weeks for plan in plans], dtype=np.int16),
+        "monthly_cost": np.array([plan.monthly_cost for plan in plans], dtype=np.int32)
+    }
+
+@functools.lru_cache(maxsize=1)
+def _milestone_columns():
+    """Typed columns for the key milestone timeline"""
+    import numpy as np
+    
+    return {
+        "week": np.array([item.week for item in _MILESTONES], dtype=np.int16),
+        "budget_spent": np.array([item.budget_spent for item in _MILESTONES], dtype=np.int32)
+    }
+
+# Milestone name -> position in _ROADMAP, used to resolve dependencies
+_NAME2IDX = {item.milestone: index for index, item in enumerate(_ROADMAP)}
+
+@functools.lru_cache(maxsize=1)
+def _roadmap_columns():
+    """Structure-of-arrays view of the roadmap, one typed column per field
+    
+    Built on first use so importing this module does not pay for NumPy.
+    """
+    import numpy as np
+    
+    return {
+        "phase": np.array([item.phase for item in _ROADMAP]),
+        "phase_idx": np.repeat(
+            np.arange(len(_PHASE_NAMES), dtype=np.int8),
+            [phase_slice.stop - phase_slice.start for phase_slice in _PHASE_SLICES.values()]
+        ),
+        "milestone": np.array([item.milestone for item in _ROADMAP]),
+        "start_week": np.array([item.start_week for item in _ROADMAP], dtype=np.int16),
+        "duration_weeks": np.array([item.duration_weeks for item in _ROADMAP], dtype=np.int16),
+        "owner": np.array([item.owner for item in _ROADMAP]),
+        "budget": np.array([item.budget for item in _ROADMAP], dtype=np.int32),
+        "risk_level": np.array([item.risk_level for item in _ROADMAP]),
+        "dep_idx": [
+            np.array([_NAME2IDX[name] for name in item.dependencies], dtype=np.int8)
+            for item in _ROADMAP
+        ]
+    }
+
+def _json_default(obj):
+    """Encode datetimes as ISO strings; anything else unexpected is an error, not str()"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _write_report_json(report, report_file):
+    """Write the JSON report, with orjson when available"""
+    if orjson is not None:
+        report_file.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        import json
+        report_file.write_text(json.dumps(report, indent=2, default=_json_default))
+
+def _write_report_msgpack(report, msgpack_file):
+    """Write a compact binary copy of the report for machine consumers"""
+    msgpack_file.write_bytes(msgpack.packb(report))
+
+def _write_roadmap_parquet(dataset_dir):
+    """Write the roadmap as a Snappy-compressed Parquet dataset partitioned by phase"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    columns = [field.name for field in fields(Milestone)]
+    table = pa.Table.from_pydict({
+        column: [
+            list(value) if isinstance(value, tuple) else value
+            for value in (getattr(item, column) for item in _ROADMAP)
+        ]
+        for column in columns
+    })
+    
+    pq.write_to_dataset(
+        table,
+        root_path=dataset_dir,
+        partition_cols=["phase"],
+        compression="snappy",
+        existing_data_behavior="delete_matching"
+    )
+
+def _write_roadmap_csv(csv_file):
+    """Write the roadmap CSV with the stdlib csv module; list columns are '|'-joined"""
+    columns = [field.name for field in fields(Milestone)]
+    
+    with open(csv_file, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(
+            ["|".join(value) if isinstance(value, tuple) else value
+             for value in (getattr(item, column) for column in columns)]
+            for item in _ROADMAP
+        )
 
 class SentinelMVPRoadmap:
     def __init__(self):
-        self.start_date = datetime(2025, 1, 1)  # Project start date
+        self.start_date = _START_DATE  # Project start date
+    
+    # The builders below return fresh objects on every call; these cached
+    # views are built once per instance and shared by report generation,
+    # so treat them as read-only.
+    
+    @functools.cached_property
+    def roadmap_data(self):
+        """Cached output of create_detailed_roadmap"""
+        return self.create_detailed_roadmap()
+    
+    @functools.cached_property
+    def milestones(self):
+        """Cached output of create_milestone_timeline"""
+        return self.create_milestone_timeline(self.roadmap_data)
+    
+    @functools.cached_property
+    def resources(self):
+        """Cached output of create_resource_plan"""
+        return self.create_resource_plan()
+    
+    @functools.cached_property
+    def risk_plan(self):
+        """Cached output of create_risk_mitigation_plan"""
+        return self.create_risk_mitigation_plan()
         
     def create_detailed_roadmap(self):
         """Create detailed MVP roadmap with milestones"""
-        
-        roadmap_data = [
-            # Phase 0: Foundation & Pilot (Months 1-3)
-            {
-                "phase": "Phase 0",
-                "milestone": "Project Initiation",
-                "start_week": 1,
-                "duration_weeks": 2,
-                "owner": "PM",
-                "dependencies": [],
-                "deliverables": ["Project charter", "Team assembly", "Stakeholder alignment"],
-                "success_criteria": ["Team hired", "Budget approved", "Stakeholders aligned"],
-                "budget": 500000,  # R500K
-                "risk_level": "Low"
-            },
-            {
-                "phase": "Phase 0",
-                "milestone": "Stakeholder Partnerships",
-                "start_week": 3,
-                "duration_weeks": 4,
-                "owner": "BD",
-                "dependencies": ["Project Initiation"],
-                "deliverables": ["Private security MoUs", "Bank partnerships", "Insurance agreements"],
-                "success_criteria": ["3+ security partners", "2+ bank partnerships", "2+ insurance partners"],
-                "budget": 300000,  # R300K
-                "risk_level": "Medium"
-            },
-            {
-                "phase": "Phase 0",
-                "milestone": "Technical Foundation",
-                "start_week": 1,
-                "duration_weeks": 8,
-                "owner": "Tech Lead",
-                "dependencies": [],
-                "deliverables": ["Infrastructure setup", "Database design", "API framework"],
-                "success_criteria": ["Cloud infrastructure ready", "Database deployed", "API endpoints functional"],
-                "budget": 800000,  # R800K
-                "risk_level": "Medium"
-            },
-            {
-                "phase": "Phase 0",
-                "milestone": "MVP ANPR System",
-                "start_week": 4,
-                "duration_weeks": 6,
-                "owner": "ML Engineer",
-                "dependencies": ["Technical Foundation"],
-                "deliverables": ["ANPR model training", "Edge deployment", "Real-time processing"],
-                "success_criteria": ["95%+ ANPR accuracy", "50ms inference time", "10+ edge devices deployed"],
-                "budget": 600000,  # R600K
-                "risk_level": "High"
-            },
-            {
-                "phase": "Phase 0",
-                "milestone": "Mobile App MVP",
-                "start_week": 6,
-                "duration_weeks": 8,
-                "owner": "Mobile Dev",
-                "dependencies": ["Technical Foundation"],
-                "deliverables": ["Android app", "iOS app", "Citizen reporting features"],
-                "success_criteria": ["App store approval", "1000+ downloads", "50+ daily active users"],
-                "budget": 400000,  # R400K
-                "risk_level": "Medium"
-            },
-            {
-                "phase": "Phase 0",
-                "milestone": "Pilot Deployment",
-                "start_week": 10,
-                "duration_weeks": 4,
-                "owner": "Ops Team",
-                "dependencies": ["MVP ANPR System", "Mobile App MVP", "Stakeholder Partnerships"],
-                "deliverables": ["Sandton CBD deployment", "User training", "Performance monitoring"],
-                "success_criteria": ["20+ edge devices active", "30% detection improvement", "User satisfaction >80%"],
-                "budget": 300000,  # R300K
-                "risk_level": "High"
-            },
-            
-            # Phase 1: Core Development (Months 4-9)
-            {
-                "phase": "Phase 1",
-                "milestone": "Advanced ML Models",
-                "start_week": 14,
-                "duration_weeks": 12,
-                "owner": "ML Engineer",
-                "dependencies": ["Pilot Deployment"],
-                "deliverables": ["Gunshot detection", "Weapon detection", "Behavioral analysis"],
-                "success_criteria": ["90%+ gunshot accuracy", "85%+ weapon detection", "Real-time processing"],
-                "budget": 1200000,  # R1.2M
-                "risk_level": "High"
-            },
-            {
-                "phase": "Phase 1",
-                "milestone": "Threat Intelligence Integration",
-                "start_week": 16,
-                "duration_weeks": 10,
-                "owner": "Security Engineer",
-                "dependencies": ["Technical Foundation"],
-                "deliverables": ["Cyber threat feeds", "OSINT integration", "Threat correlation"],
-                "success_criteria": ["5+ threat feeds integrated", "Real-time correlation", "Automated alerts"],
-                "budget": 800000,  # R800K
-                "risk_level": "Medium"
-            },
-            {
-                "phase": "Phase 1",
-                "milestone": "Bank Integration",
-                "start_week": 18,
-                "duration_weeks": 8,
-                "owner": "Integration Engineer",
-                "dependencies": ["Stakeholder Partnerships"],
-                "deliverables": ["Fraud detection API", "Real-time alerts", "Cross-domain correlation"],
-                "success_criteria": ["2+ banks integrated", "Fraud detection working", "Response time <5min"],
-                "budget": 1000000,  # R1M
-                "risk_level": "High"
-            },
-            {
-                "phase": "Phase 1",
-                "milestone": "Scale to 3 Cities",
-                "start_week": 20,
-                "duration_weeks": 16,
-                "owner": "Ops Team",
-                "dependencies": ["Advanced ML Models", "Threat Intelligence Integration"],
-                "deliverables": ["Cape Town deployment", "Durban deployment", "Performance optimization"],
-                "success_criteria": ["100+ edge devices", "3 cities active", "40% detection improvement"],
-                "budget": 2000000,  # R2M
-                "risk_level": "Medium"
-            },
-            
-            # Phase 2: Scale & Integration (Months 10-21)
-            {
-                "phase": "Phase 2",
-                "milestone": "National Infrastructure",
-                "start_week": 36,
-                "duration_weeks": 20,
-                "owner": "Infrastructure Team",
-                "dependencies": ["Scale to 3 Cities"],
-                "deliverables": ["Multi-region deployment", "Load balancing", "Disaster recovery"],
-                "success_criteria": ["9 provinces covered", "99.9% uptime", "Auto-scaling working"],
-                "budget": 3000000,  # R3M
-                "risk_level": "Medium"
-            },
-            {
-                "phase": "Phase 2",
-                "milestone": "Advanced Analytics",
-                "start_week": 40,
-                "duration_weeks": 16,
-                "owner": "Data Scientist",
-                "dependencies": ["National Infrastructure"],
-                "deliverables": ["Predictive analytics", "Crime forecasting", "Pattern recognition"],
-                "success_criteria": ["80%+ prediction accuracy", "Real-time forecasting", "Pattern detection"],
-                "budget": 1500000,  # R1.5M
-                "risk_level": "High"
-            },
-            {
-                "phase": "Phase 2",
-                "milestone": "Law Enforcement Gateway",
-                "start_week": 44,
-                "duration_weeks": 12,
-                "owner": "Legal/Compliance",
-                "dependencies": ["Advanced Analytics"],
-                "deliverables": ["LE portal", "Audit trails", "Legal compliance"],
-                "success_criteria": ["Legal approval", "Audit compliance", "LE adoption"],
-                "budget": 2000000,  # R2M
-                "risk_level": "High"
-            },
-            {
-                "phase": "Phase 2",
-                "milestone": "Full Ecosystem Integration",
-                "start_week": 48,
-                "duration_weeks": 20,
-                "owner": "Integration Team",
-                "dependencies": ["Law Enforcement Gateway"],
-                "deliverables": ["All banks integrated", "Insurance integration", "Government systems"],
-                "success_criteria": ["10+ banks", "5+ insurers", "Government approval"],
-                "budget": 3500000,  # R3.5M
-                "risk_level": "Medium"
-            },
-            
-            # Phase 3: National Deployment (Months 22-30)
-            {
-                "phase": "Phase 3",
-                "milestone": "National Rollout",
-                "start_week": 68,
-                "duration_weeks": 24,
-                "owner": "Ops Team",
-                "dependencies": ["Full Ecosystem Integration"],
-                "deliverables": ["National deployment", "User training", "Support systems"],
-                "success_criteria": ["500+ edge devices", "50,000+ users", "45% crime reduction"],
-                "budget": 5000000,  # R5M
-                "risk_level": "Low"
-            }
-        ]
-        
-        return roadmap_data
+        return [asdict(item, dict_factory=_record) for item in _ROADMAP]
     
     def create_milestone_timeline(self, roadmap_data):
         """Create milestone timeline with key deliverables"""
-        
-        milestones = [
-            {
-                "week": 12,
-                "milestone": "Phase 0 Complete",
-                "description": "Pilot deployment in Sandton CBD",
-                "key_metrics": ["20+ edge devices", "30% detection improvement", "1000+ app users"],
-                "deliverables": ["MVP ANPR system", "Mobile app", "Basic dashboard"],
-                "budget_spent": 2900000,  # R2.9M
-                "roi_achieved": "30% detection improvement"
-            },
-            {
-                "week": 24,
-                "milestone": "Phase 1 Complete", 
-                "description": "3 cities deployed with advanced features",
-                "key_metrics": ["100+ edge devices", "40% detection improvement", "10,000+ users"],
-                "deliverables": ["Gunshot detection", "Threat intelligence", "Bank integration"],
-                "budget_spent": 7900000,  # R7.9M
-                "roi_achieved": "40% detection improvement"
-            },
-            {
-                "week": 36,
-                "milestone": "Phase 2 Complete",
-                "description": "National infrastructure with full integration",
-                "key_metrics": ["300+ edge devices", "45% detection improvement", "25,000+ users"],
-                "deliverables": ["National infrastructure", "Advanced analytics", "LE gateway"],
-                "budget_spent": 14900000,  # R14.9M
-                "roi_achieved": "45% detection improvement"
-            },
-            {
-                "week": 48,
-                "milestone": "Full Ecosystem",
-                "description": "Complete integration with all partners",
-                "key_metrics": ["500+ edge devices", "50% detection improvement", "50,000+ users"],
-                "deliverables": ["All banks integrated", "Insurance integration", "Government systems"],
-                "budget_spent": 19900000,  # R19.9M
-                "roi_achieved": "50% detection improvement"
-            },
-            {
-                "week": 68,
-                "milestone": "National Deployment",
-                "description": "Full national rollout complete",
-                "key_metrics": ["1000+ edge devices", "55% detection improvement", "100,000+ users"],
-                "deliverables": ["National coverage", "Full ecosystem", "Operational excellence"],
-                "budget_spent": 24900000,  # R24.9M
-                "roi_achieved": "55% detection improvement"
-            }
-        ]
-        
-        return milestones
+        return [asdict(item, dict_factory=_record) for item in _MILESTONES]
     
     def create_resource_plan(self):
         """Create resource allocation plan"""
-        
-        resources = {
-            "Phase 0": {
-                "team_size": 8,
-                "roles": {
-                    "Product Manager": 1,
-                    "Tech Lead": 1,
-                    "ML Engineer": 1,
-                    "Backend Developer": 2,
-                    "Mobile Developer": 1,
-                    "DevOps Engineer": 1,
-                    "Business Development": 1
-                },
-                "budget": 2900000,  # R2.9M
-                "duration_weeks": 12,
-                "monthly_cost": 241667  # R241K/month
-            },
-            "Phase 1": {
-                "team_size": 12,
-                "roles": {
-                    "Product Manager": 1,
-                    "Tech Lead": 1,
-                    "ML Engineer": 2,
-                    "Backend Developer": 3,
-                    "Frontend Developer": 1,
-                    "Mobile Developer": 1,
-                    "DevOps Engineer": 1,
-                    "Security Engineer": 1,
-                    "Business Development": 1
-                },
-                "budget": 5000000,  # R5M
-                "duration_weeks": 24,
-                "monthly_cost": 208333  # R208K/month
-            },
-            "Phase 2": {
-                "team_size": 18,
-                "roles": {
-                    "Product Manager": 1,
-                    "Tech Lead": 1,
-                    "ML Engineer": 3,
-                    "Backend Developer": 4,
-                    "Frontend Developer": 2,
-                    "Mobile Developer": 1,
-                    "DevOps Engineer": 2,
-                    "Security Engineer": 2,
-                    "Data Scientist": 1,
-                    "Legal/Compliance": 1
-                },
-                "budget": 10000000,  # R10M
-                "duration_weeks": 36,
-                "monthly_cost": 277778  # R278K/month
-            },
-            "Phase 3": {
-                "team_size": 25,
-                "roles": {
-                    "Product Manager": 2,
-                    "Tech Lead": 2,
-                    "ML Engineer": 4,
-                    "Backend Developer": 6,
-                    "Frontend Developer": 3,
-                    "Mobile Developer": 2,
-                    "DevOps Engineer": 3,
-                    "Security Engineer": 2,
-                    "Data Scientist": 2,
-                    "Legal/Compliance": 1,
-                    "Support Engineer": 2
-                },
-                "budget": 15000000,  # R15M
-                "duration_weeks": 24,
-                "monthly_cost": 625000  # R625K/month
-            }
+        return {
+            phase: asdict(plan, dict_factory=_record)
+            for phase, plan in _RESOURCES.items()
         }
-        
-        return resources
     
     def create_risk_mitigation_plan(self):
         """Create comprehensive risk mitigation plan"""
-        
-        risk_plan = {
-            "technical_risks": [
-                {
-                    "risk": "ML model accuracy below target",
-                    "probability": "Medium",
-                    "impact": "High",
-                    "mitigation": [
-                        "Extended training with augmented data",
-                        "Multiple model ensemble approach",
-                        "Continuous model improvement pipeline",
-                        "Fallback to rule-based systems"
-                    ],
-                    "contingency_budget": 500000  # R500K
-                },
-                {
-                    "risk": "Edge device deployment challenges",
-                    "probability": "High",
-                    "impact": "Medium",
-                    "mitigation": [
-                        "Pilot testing with multiple vendors",
-                        "Vendor partnerships and support agreements",
-                        "Modular hardware design",
-                        "Remote device management system"
-                    ],
-                    "contingency_budget": 300000  # R300K
-                },
-                {
-                    "risk": "Integration complexity with legacy systems",
-                    "probability": "Medium",
-                    "impact": "High",
-                    "mitigation": [
-                        "API-first design approach",
-                        "Modular architecture with microservices",
-                        "Comprehensive testing framework",
-                        "Gradual integration rollout"
-                    ],
-                    "contingency_budget": 400000  # R400K
-                }
-            ],
-            "business_risks": [
-                {
-                    "risk": "Partner adoption slower than expected",
-                    "probability": "Medium",
-                    "impact": "High",
-                    "mitigation": [
-                        "Early engagement and value demonstration",
-                        "Pilot programs with key partners",
-                        "Flexible integration options",
-                        "Strong ROI documentation"
-                    ],
-                    "contingency_budget": 200000  # R200K
-                },
-                {
-                    "risk": "Regulatory approval delays",
-                    "probability": "Low",
-                    "impact": "High",
-                    "mitigation": [
-                        "Early legal consultation and compliance framework",
-                        "Proactive engagement with regulators",
-                        "Privacy by design implementation",
-                        "Legal review of all data handling"
-                    ],
-                    "contingency_budget": 300000  # R300K
-                },
-                {
-                    "risk": "Competition from established players",
-                    "probability": "Medium",
-                    "impact": "Medium",
-                    "mitigation": [
-                        "Unique value proposition development",
-                        "First-mover advantage in South Africa",
-                        "Strong intellectual property protection",
-                        "Continuous innovation and improvement"
-                    ],
-                    "contingency_budget": 100000  # R100K
-                }
-            ],
-            "operational_risks": [
-                {
-                    "risk": "Team scaling challenges",
-                    "probability": "Medium",
-                    "impact": "Medium",
-                    "mitigation": [
-                        "Gradual hiring with knowledge transfer",
-                        "Strong documentation and processes",
-                        "Remote work capabilities",
-                        "Partnership with local universities"
-                    ],
-                    "contingency_budget": 150000  # R150K
-                },
-                {
-                    "risk": "Infrastructure scaling issues",
-                    "probability": "Low",
-                    "impact": "High",
-                    "mitigation": [
-                        "Cloud-native architecture with auto-scaling",
-                        "Multi-region deployment strategy",
-                        "Comprehensive monitoring and alerting",
-                        "Disaster recovery and backup systems"
-                    ],
-                    "contingency_budget": 250000  # R250K
-                },
-                {
-                    "risk": "User adoption challenges",
-                    "probability": "Medium",
-                    "impact": "Medium",
-                    "mitigation": [
-                        "User-centric design and testing",
-                        "Comprehensive training programs",
-                        "Strong customer support",
-                        "Incentive programs for early adopters"
-                    ],
-                    "contingency_budget": 100000  # R100K
-                }
-            ]
+        return {
+            category: [asdict(risk, dict_factory=_record) for risk in risks]
+            for category, risks in _RISK_PLAN.items()
         }
+    
+    def phase_milestones(self, phase):
+        """Return the roadmap records for one phase without scanning the roadmap"""
+        return _ROADMAP[_PHASE_SLICES[phase]]
+    
+    @functools.cached_property
+    def phase_budgets(self):
+        """Budget per phase, reduced with one np.bincount over the phase codes"""
+        import numpy as np
+        
+        columns = _roadmap_columns()
+        totals = np.bincount(
+            columns["phase_idx"],
+            weights=columns["budget"],
+            minlength=len(_PHASE_NAMES)
+        ).astype(np.int64)
         
-        return risk_plan
+        return {phase: int(total) for phase, total in zip(_PHASE_NAMES, totals)}
     
-    def generate_roadmap_report(self):
-        """Generate comprehensive roadmap report"""
+    def active_milestones(self, week):
+        """Return the names of milestones in progress during the given week"""
+        order, starts, ends = _schedule_index()
         
-        roadmap_data = self.create_detailed_roadmap()
-        milestones = self.create_milestone_timeline(roadmap_data)
-        resources = self.create_resource_plan()
-        risk_plan = self.create_risk_mitigation_plan()
+        # Only milestones starting on or before the week can be active
+        started = starts.searchsorted(week, side="right")
+        active = order[:started][ends[:started] > week]
         
-        # Calculate totals
-        total_budget = sum(item["budget"] for item in roadmap_data)
-        total_contingency = sum(
-            sum(risk["contingency_budget"] for risk in phase_risks) 
-            for phase_risks in risk_plan.values()
-        )
+        return [_ROADMAP[index].milestone for index in active]
+    
+    def critical_path(self):
+        """Return the milestone names on the longest dependency chain by duration"""
+        import numpy as np
+        
+        columns = _roadmap_columns()
+        count = len(_ROADMAP)
+        durations = columns["duration_weeks"].astype(np.int64)
+        
+        # depends_on[i, j] is True when milestone i depends on milestone j
+        depends_on = np.zeros((count, count), dtype=bool)
+        for index, dep_idx in enumerate(columns["dep_idx"]):
+            depends_on[index, dep_idx] = True
         
-        # Create comprehensive report
-        report = {
-            "project_overview": {
-                "name": "Sentinel MVP Product Roadmap",
-                "total_duration_weeks": 92,
-                "total_duration_months": 23,
-                "total_budget": total_budget,
-                "contingency_budget": total_contingency,
-                "total_project_budget": total_budget + total_contingency,
-                "start_date": self.start_date.isoformat(),
-                "end_date": (self.start_date + timedelta(weeks=92)).isoformat(),
-                "phases": 4,
-                "milestones": len(roadmap_data),
-                "key_milestones": len(milestones)
+        # Kahn's algorithm, one whole topological level per iteration
+        finish = np.zeros(count, dtype=np.int64)
+        remaining = np.ones(count, dtype=bool)
+        while remaining.any():
+            ready = remaining & ~(depends_on & remaining).any(axis=1)
+            if not ready.any():
+                raise ValueError("Roadmap dependencies contain a cycle")
+            
+            finish[ready] = np.where(depends_on[ready], finish, 0).max(axis=1) + durations[ready]
+            remaining &= ~ready
+        
+        # Walk back from the latest finish through the latest-finishing dependency
+        path = [int(finish.argmax())]
+        while depends_on[path[-1]].any():
+            dep_idx = np.flatnonzero(depends_on[path[-1]])
+            path.append(int(dep_idx[finish[dep_idx].argmax()]))
+        
+        return [_ROADMAP[index].milestone for index in reversed(path)]
+    
+    def generate_roadmap_report(self, legacy_csv=False):
+        """Generate comprehensive roadmap report
+        
+        The roadmap table is written as a Parquet dataset partitioned by
+        phase when pyarrow is installed; pass legacy_csv=True (or run
+        without pyarrow) to get the flat CSV instead.
+        """
+        
+        # Callers get their own copy, so mutating it cannot corrupt the cached build
+        report = copy.deepcopy(_build_report())
+        
+        # Save report and roadmap table; JSON is the human-readable view, the
+        # msgpack snapshot (when msgpack is installed) is for programmatic loaders
+        report_file = Path("real_data/sentinel_mvp_roadmap_report.json")
+        msgpack_file = report_file.with_suffix(".msgpack")
+        report_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        if legacy_csv or importlib.util.find_spec("pyarrow") is None:
+            table_file = Path("real_data/sentinel_mvp_roadmap.csv")
+            table_write = (_write_roadmap_csv, (table_file,))
+        else:
+            table_file = Path("real_data/sentinel_mvp_roadmap.parquet")
+            table_write = (_write_roadmap_parquet, (table_file,))
+        
+        writes = [
+            (_write_report_json, (report, report_file)),
+            table_write
+        ]
+        if msgpack is not None:
+            writes.append((_write_report_msgpack, (report, msgpack_file)))
+        
+        # Always rewrite: other scripts (mvp_roadmap_gantt.py) write the same
+        # report path, so existing files say nothing about this module's output.
+        # The independent writes overlap
+        with ThreadPoolExecutor(max_workers=len(writes)) as executor:
+            for future in [executor.submit(write, *args) for write, args in writes]:
+                future.result()
+        
+        return report, report_file, table_file
+
+@functools.cache
+def _build_report():
+    """Build the roadmap report once per process; generate_roadmap_report hands out deep copies
+    
+    The report depends only on the module's roadmap tables, never on
+    instance state, so one private instance serves every caller.
+    """
+    roadmap = SentinelMVPRoadmap()
+    
+    roadmap_data = roadmap.roadmap_data
+    milestones = roadmap.milestones
+    resources = roadmap.resources
+    risk_plan = roadmap.risk_plan
+    
+    phase_budgets = roadmap.phase_budgets
+    total_budget = _TOTAL_BUDGET
+    total_contingency = _TOTAL_CONTINGENCY
+    
+    # Create comprehensive report
+    report = {
+        "project_overview": {
+            "name": "Sentinel MVP Product Roadmap",
+            "total_duration_weeks": _DURATION_WEEKS,
+            "total_duration_months": 23,
+            "total_budget": total_budget,
+            "contingency_budget": total_contingency,
+            "total_project_budget": total_budget + total_contingency,
+            "start_date": _START_ISO,
+            "end_date": _END_ISO,
+            "phases": 4,
+            "milestones": len(roadmap_data),
+            "key_milestones": len(milestones)
+        },
+        "phases": {
+            "Phase 0": {"duration": 12, "description": "Foundation & Pilot", "budget": phase_budgets["Phase 0"]},
+            "Phase 1": {"duration": 24, "description": "Core Development", "budget": phase_budgets["Phase 1"]},
+            "Phase 2": {"duration": 36, "description": "Scale & Integration", "budget": phase_budgets["Phase 2"]},
+            "Phase 3": {"duration": 24, "description": "National Deployment", "budget": phase_budgets["Phase 3"]}
+        },
+        "roadmap": roadmap_data,
+        "milestones": milestones,
+        "resources": resources,
+        "risk_mitigation": risk_plan,
+        "success_metrics": {
+            "phase_0": {
+                "technical": ["95%+ ANPR accuracy", "50ms inference time", "20+ edge devices"],
+                "business": ["3+ security partners", "1000+ app users", "30% detection improvement"],
+                "operational": ["Team assembled", "Infrastructure ready", "Pilot deployed"]
+            },
+            "phase_1": {
+                "technical": ["90%+ gunshot accuracy", "100+ edge devices", "Real-time correlation"],
+                "business": ["10,000+ users", "40% detection improvement", "Bank integration"],
+                "operational": ["3 cities deployed", "Advanced features", "Threat intelligence"]
             },
-            "phases": {
-                "Phase 0": {"duration": 12, "description": "Foundation & Pilot", "budget": 2900000},
-                "Phase 1": {"duration": 24, "description": "Core Development", "budget": 5000000},
-                "Phase 2": {"duration": 36, "description": "Scale & Integration", "budget": 10000000},
-                "Phase 3": {"duration": 24, "description": "National Deployment", "budget": 15000000}
+            "phase_2": {
+                "technical": ["500+ edge devices", "99.9% uptime", "Predictive analytics"],
+                "business": ["50,000+ users", "45% detection improvement", "Full ecosystem"],
+                "operational": ["National infrastructure", "LE gateway", "Government approval"]
             },
-            "roadmap": roadmap_data,
-            "milestones": milestones,
-            "resources": resources,
-            "risk_mitigation": risk_plan,
-            "success_metrics": {
-                "phase_0": {
-                    "technical": ["95%+ ANPR accuracy", "50ms inference time", "20+ edge devices"],
-                    "business": ["3+ security partners", "1000+ app users", "30% detection improvement"],
-                    "operational": ["Team assembled", "Infrastructure ready", "Pilot deployed"]
-                },
-                "phase_1": {
-                    "technical": ["90%+ gunshot accuracy", "100+ edge devices", "Real-time correlation"],
-                    "business": ["10,000+ users", "40% detection improvement", "Bank integration"],
-                    "operational": ["3 cities deployed", "Advanced features", "Threat intelligence"]
-                },
-                "phase_2": {
-                    "technical": ["500+ edge devices", "99.9% uptime", "Predictive analytics"],
-                    "business": ["50,000+ users", "45% detection improvement", "Full ecosystem"],
-                    "operational": ["National infrastructure", "LE gateway", "Government approval"]
-                },
-                "phase_3": {
-                    "technical": ["1000+ edge devices", "55% detection improvement", "Operational excellence"],
-                    "business": ["100,000+ users", "National coverage", "Market leadership"],
-                    "operational": ["Full deployment", "Support systems", "Continuous improvement"]
-                }
+            "phase_3": {
+                "technical": ["1000+ edge devices", "55% detection improvement", "Operational excellence"],
+                "business": ["100,000+ users", "National coverage", "Market leadership"],
+                "operational": ["Full deployment", "Support systems", "Continuous improvement"]
+            }
+        },
+        "roi_projections": {
+            "year_1": {
+                "investment": 7900000,  # R7.9M
+                "savings": 50000000,   # R50M
+                "roi": 533
+            },
+            "year_2": {
+                "investment": 19900000,  # R19.9M
+                "savings": 150000000,   # R150M
+                "roi": 654
             },
-            "roi_projections": {
-                "year_1": {
-                    "investment": 7900000,  # R7.9M
-                    "savings": 50000000,   # R50M
-                    "roi": 533
-                },
-                "year_2": {
-                    "investment": 19900000,  # R19.9M
-                    "savings": 150000000,   # R150M
-                    "roi": 654
-                },
-                "year_3": {
-                    "investment": 24900000,  # R24.9M
-                    "savings": 300000000,   # R300M
-                    "roi": 1105
-                }
+            "year_3": {
+                "investment": 24900000,  # R24.9M
+                "savings": 300000000,   # R300M
+                "roi": 1105
             }
         }
-        
-        # Save report
-        report_file = Path("real_data/sentinel_mvp_roadmap_report.json")
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
-        
-        # Create CSV for easy viewing
-        df = pd.DataFrame(roadmap_data)
-        csv_file = Path("real_data/sentinel_mvp_roadmap.csv")
-        df.to_csv(csv_file, index=False)
-        
-        return report, report_file, csv_file
+    }
+    
+    return report
 
-if __name__ == "__main__":
+def main():
+    """Generate the roadmap and print a summary in a single stdout write"""
     roadmap = SentinelMVPRoadmap()
-    report, report_file, csv_file = roadmap.generate_roadmap_report()
-    
-    print("🎯 Sentinel MVP Roadmap Generated Successfully!")
-    print(f"📋 Report saved to: {report_file}")
-    print(f"📊 CSV saved to: {csv_file}")
-    print(f"⏱️  Total Duration: 23 months (92 weeks)")
-    print(f"💰 Total Budget: R{report['project_overview']['total_budget']:,}")
-    print(f"🛡️  Contingency Budget: R{report['project_overview']['contingency_budget']:,}")
-    print(f"📈 Total Project Budget: R{report['project_overview']['total_project_budget']:,}")
-    print(f"🎯 Key Milestones: {report['project_overview']['key_milestones']} major milestones")
-    print(f"👥 Peak Team Size: 25 people")
-    print(f"📊 Expected ROI: {report['roi_projections']['year_3']['roi']}% by year 3")
+    report, report_file, table_file = roadmap.generate_roadmap_report(
+        legacy_csv="--legacy-csv" in sys.argv[1:]
+    )
+    overview = report['project_overview']
+    
+    lines = [
+        "🎯 Sentinel MVP Roadmap Generated Successfully!",
+        f"📋 Report saved to: {report_file}",
+        f"📊 Roadmap table saved to: {table_file}",
+        f"⏱️  Total Duration: 23 months ({_DURATION_WEEKS} weeks)",
+        f"💰 Total Budget: R{overview['total_budget']:,}",
+        f"🛡️  Contingency Budget: R{overview['contingency_budget']:,}",
+        f"📈 Total Project Budget: R{overview['total_project_budget']:,}",
+        f"🎯 Key Milestones: {overview['key_milestones']} major milestones",
+        f"👥 Peak Team Size: {int(_resource_columns()['team_size'].max())} people",
+        f"📊 Expected ROI: {report['roi_projections']['year_3']['roi']}% by year 3"
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+if __name__ == "__main__":
+    main()
@@ -4,15 +4,358 @@ Sentinel MVP Product Roadmap with GANTT Chart
 Detailed milestone-based roadmap with timeline visualization
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
+import functools
+import hashlib
+import io
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 import numpy as np
 import json
+import os
 from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional fast path; the stdlib encoder is used otherwise
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:  # optional; kernels run as plain Python/NumPy without it
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+@dataclass(frozen=True, slots=True)
+class GanttMilestone:
+    """Data class for roadmap milestones as the Gantt chart schedules them (no budget or risk)"""
+    phase: str
+    milestone: str
+    start_week: int
+    duration_weeks: int
+    owner: str
+    dependencies: Tuple[str, ...]
+    deliverables: Tuple[str, ...]
+    success_criteria: Tuple[str, ...]
+
+_ROADMAP_DATA = (
+    # Phase 0: Foundation & Pilot (Months 1-3)
+    GanttMilestone(
+        phase="Phase 0",
+        milestone="Project Initiation",
+        start_week=1,
+        duration_weeks=2,
+        owner="PM",
+        dependencies=(),
+        deliverables=("Project charter", "Team assembly", "Stakeholder alignment"),
+        success_criteria=("Team hired", "Budget approved", "Stakeholders aligned")
+    ),
+    GanttMilestone(
+        phase="Phase 0",
+        milestone="Stakeholder Partnerships",
+        start_week=3,
+        duration_weeks=4,
+        owner="BD",
+        dependencies=("Project Initiation",),
+        deliverables=("Private security MoUs", "Bank partnerships", "Insurance agreements"),
+        success_criteria=("3+ security partners", "2+ bank partnerships", "2+ insurance partners")
+    ),
+    GanttMilestone(
+        phase="Phase 0",
+        milestone="Technical Foundation",
+        start_week=1,
+        duration_weeks=8,
+        owner="Tech Lead",
+        dependencies=(),
+        deliverables=("Infrastructure setup", "Database design", "API framework"),
+        success_criteria=("Cloud infrastructure ready", "Database deployed", "API endpoints functional")
+    ),
+    GanttMilestone(
+        phase="Phase 0",
+        milestone="MVP ANPR System",
+        start_week=4,
+        duration_weeks=6,
+        owner="ML Engineer",
+        dependencies=("Technical Foundation",),
+        deliverables=("ANPR model training", "Edge deployment", "Real-time processing"),
+        success_criteria=("95%+ ANPR accuracy", "50ms inference time", "10+ edge devices deployed")
+    ),
+    GanttMilestone(
+        phase="Phase 0",
+        milestone="Mobile App MVP",
+        start_week=6,
+        duration_weeks=8,
+        owner="Mobile Dev",
+        dependencies=("Technical Foundation",),
+        deliverables=("Android app", "iOS app", "Citizen reporting features"),
+        success_criteria=("App store approval", "1000+ downloads", "50+ daily active users")
+    ),
+    GanttMilestone(
+        phase="Phase 0",
+        milestone="Pilot Deployment",
+        start_week=10,
+        duration_weeks=4,
+        owner="Ops Team",
+        dependencies=("MVP ANPR System", "Mobile App MVP", "Stakeholder Partnerships"),
+        deliverables=("Sandton CBD deployment", "User training", "Performance monitoring"),
+        success_criteria=("20+ edge devices active", "30% detection improvement", "User satisfaction >80%")
+    ),
+    
+    # Phase 1: Core Development (Months 4-9)
+    GanttMilestone(
+        phase="Phase 1",
+        milestone="Advanced ML Models",
+        start_week=14,
+        duration_weeks=12,
+        owner="ML Engineer",
+        dependencies=("Pilot Deployment",),
+        deliverables=("Gunshot detection", "Weapon detection", "Behavioral analysis"),
+        success_criteria=("90%+ gunshot accuracy", "85%+ weapon detection", "Real-time processing")
+    ),
+    GanttMilestone(
+        phase="Phase 1",
+        milestone="Threat Intelligence Integration",
+        start_week=16,
+        duration_weeks=10,
+        owner="Security Engineer",
+        dependencies=("Technical Foundation",),
+        deliverables=("Cyber threat feeds", "OSINT integration", "Threat correlation"),
+        success_criteria=("5+ threat feeds integrated", "Real-time correlation", "Automated alerts")
+    ),
+    GanttMilestone(
+        phase="Phase 1",
+        milestone="Bank Integration",
+        start_week=18,
+        duration_weeks=8,
+        owner="Integration Engineer",
+        dependencies=("Stakeholder Partnerships",),
+        deliverables=("Fraud detection API", "Real-time alerts", "Cross-domain correlation"),
+        success_criteria=("2+ banks integrated", "Fraud detection working", "Response time <5min")
+    ),
+    GanttMilestone(
+        phase="Phase 1",
+        milestone="Scale to 3 Cities",
+        start_week=20,
+        duration_weeks=16,
+        owner="Ops Team",
+        dependencies=("Advanced ML Models", "Threat Intelligence Integration"),
+        deliverables=("Cape Town deployment", "Durban deployment", "Performance optimization"),
+        success_criteria=("100+ edge devices", "3 cities active", "40% detection improvement")
+    ),
+    
+    # Phase 2: Scale & Integration (Months 10-21)
+    GanttMilestone(
+        phase="Phase 2",
+        milestone="National Infrastructure",
+        start_week=36,
+        duration_weeks=20,
+        owner="Infrastructure Team",
+        dependencies=("Scale to 3 Cities",),
+        deliverables=("Multi-region deployment", "Load balancing", "Disaster recovery"),
+        success_criteria=("9 provinces covered", "99.9% uptime", "Auto-scaling working")
+    ),
+    GanttMilestone(
+        phase="Phase 2",
+        milestone="Advanced Analytics",
+        start_week=40,
+        duration_weeks=16,
+        owner="Data Scientist",
+        dependencies=("National Infrastructure",),
+        deliverables=("Predictive analytics", "Crime forecasting", "Pattern recognition"),
+        success_criteria=("80%+ prediction accuracy", "Real-time forecasting", "Pattern detection")
+    ),
+    GanttMilestone(
+        phase="Phase 2",
+        milestone="Law Enforcement Gateway",
+        start_week=44,
+        duration_weeks=12,
+        owner="Legal/Compliance",
+        dependencies=("Advanced Analytics",),
+        deliverables=("LE portal", "Audit trails", "Legal compliance"),
+        success_criteria=("Legal approval", "Audit compliance", "LE adoption")
+    ),
+    GanttMilestone(
+        phase="Phase 2",
+        milestone="Full Ecosystem Integration",
+        start_week=48,
+        duration_weeks=20,
+        owner="Integration Team",
+        dependencies=("Law Enforcement Gateway",),
+        deliverables=("All banks integrated", "Insurance integration", "Government systems"),
+        success_criteria=("10+ banks", "5+ insurers", "Government approval")
+    ),
+    
+    # Phase 3: National Deployment (Months 22-30)
+    GanttMilestone(
+        phase="Phase 3",
+        milestone="National Rollout",
+        start_week=68,
+        duration_weeks=24,
+        owner="Ops Team",
+        dependencies=("Full Ecosystem Integration",),
+        deliverables=("National deployment", "User training", "Support systems"),
+        success_criteria=("500+ edge devices", "50,000+ users", "45% crime reduction")
+    )
+)
+
+# Static plan data shared by every SentinelMVPRoadmap instance
+_MILESTONE_TIMELINE = (
+    {
+        "week": 12,
+        "milestone": "Phase 0 Complete",
+        "description": "Pilot deployment in Sandton CBD",
+        "key_metrics": ["20+ edge devices", "30% detection improvement", "1000+ app users"],
+        "deliverables": ["MVP ANPR system", "Mobile app", "Basic dashboard"]
+    },
+    {
+        "week": 24,
+        "milestone": "Phase 1 Complete", 
+        "description": "3 cities deployed with advanced features",
+        "key_metrics": ["100+ edge devices", "40% detection improvement", "10,000+ users"],
+        "deliverables": ["Gunshot detection", "Threat intelligence", "Bank integration"]
+    },
+    {
+        "week": 36,
+        "milestone": "Phase 2 Complete",
+        "description": "National infrastructure with full integration",
+        "key_metrics": ["300+ edge devices", "45% detection improvement", "25,000+ users"],
+        "deliverables": ["National infrastructure", "Advanced analytics", "LE gateway"]
+    },
+    {
+        "week": 48,
+        "milestone": "Full Ecosystem",
+        "description": "Complete integration with all partners",
+        "key_metrics": ["500+ edge devices", "50% detection improvement", "50,000+ users"],
+        "deliverables": ["All banks integrated", "Insurance integration", "Government systems"]
+    },
+    {
+        "week": 68,
+        "milestone": "National Deployment",
+        "description": "Full national rollout complete",
+        "key_metrics": ["1000+ edge devices", "55% detection improvement", "100,000+ users"],
+        "deliverables": ["National coverage", "Full ecosystem", "Operational excellence"]
+    }
+)
+
+_RESOURCES = MappingProxyType({
+    "Phase 0": {
+        "team_size": 8,
+        "roles": {
+            "Product Manager": 1,
+            "Tech Lead": 1,
+            "ML Engineer": 1,
+            "Backend Developer": 2,
+            "Mobile Developer": 1,
+            "DevOps Engineer": 1,
+            "Business Development": 1
+        },
+        "budget": 2500000,  # R2.5M
+        "duration_weeks": 12
+    },
+    "Phase 1": {
+        "team_size": 12,
+        "roles": {
+            "Product Manager": 1,
+            "Tech Lead": 1,
+            "ML Engineer": 2,
+            "Backend Developer": 3,
+            "Frontend Developer": 1,
+            "Mobile Developer": 1,
+            "DevOps Engineer": 1,
+            "Security Engineer": 1,
+            "Business Development": 1
+        },
+        "budget": 5000000,  # R5M
+        "duration_weeks": 24
+    },
+    "Phase 2": {
+        "team_size": 18,
+        "roles": {
+            "Product Manager": 1,
+            "Tech Lead": 1,
+            "ML Engineer": 3,
+            "Backend Developer": 4,
+            "Frontend Developer": 2,
+            "Mobile Developer": 1,
+            "DevOps Engineer": 2,
+            "Security Engineer": 2,
+            "Data Scientist": 1,
+            "Legal/Compliance": 1
+        },
+        "budget": 10000000,  # R10M
+        "duration_weeks": 36
+    },
+    "Phase 3": {
+        "team_size": 25,
+        "roles": {
+            "Product Manager": 2,
+            "Tech Lead": 2,
+            "ML Engineer": 4,
+            "Backend Developer": 6,
+            "Frontend Developer": 3,
+            "Mobile Developer": 2,
+            "DevOps Engineer": 3,
+            "Security Engineer": 2,
+            "Data Scientist": 2,
+            "Legal/Compliance": 1,
+            "Support Engineer": 2
+        },
+        "budget": 15000000,  # R15M
+        "duration_weeks": 24
+    }
+})
+
+# Rendered GANTT PNGs keyed by a digest of the data they were drawn from
+_PNG_CACHE: Dict[str, bytes] = {}
+
+def _chart_key(roadmap_data, start_date, phase_colors):
+    """BLAKE2b digest of the inputs the GANTT chart is drawn from"""
+    payload = [start_date.isoformat(), phase_colors, [asdict(item) for item in roadmap_data]]
+    data = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def _write_atomic(path, data):
+    """Write bytes to a temp file beside path and swap it in, so readers never see a partial file"""
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+def _schedule_arrays(roadmap_data):
+    """int32 start/duration columns and a CSR dependency graph (row i lists i's prerequisites)"""
+    index = {item.milestone: i for i, item in enumerate(roadmap_data)}
+    start_weeks = np.array([item.start_week for item in roadmap_data], dtype=np.int32)
+    durations = np.array([item.duration_weeks for item in roadmap_data], dtype=np.int32)
+    indptr = np.zeros(len(roadmap_data) + 1, dtype=np.int32)
+    indptr[1:] = np.cumsum([len(item.dependencies) for item in roadmap_data])
+    indices = np.array([index[name] for item in roadmap_data for name in item.dependencies], dtype=np.int32)
+    return start_weeks, durations, indptr, indices
+
+@njit(cache=True)
+def _earliest_starts(durations, indptr, indices):
+    """Longest-path earliest start offset (in weeks) of each milestone over the dependency graph"""
+    n = durations.shape[0]
+    earliest = np.zeros(n, dtype=np.int32)
+    # Bellman-Ford style relaxation; a DAG settles within n passes
+    for _ in range(n):
+        changed = False
+        for i in range(n):
+            for k in range(indptr[i], indptr[i + 1]):
+                dep = indices[k]
+                finish = earliest[dep] + durations[dep]
+                if finish > earliest[i]:
+                    earliest[i] = finish
+                    changed = True
+        if not changed:
+            return earliest
+    raise ValueError("Roadmap dependencies contain a cycle")
 
 class SentinelMVPRoadmap:
+    # Schedule as NumPy arrays, shared by the chart and the schedule kernels
+    _start_weeks, _durations, _dep_indptr, _dep_indices = _schedule_arrays(_ROADMAP_DATA)
+    
     def __init__(self):
         self.start_date = datetime(2025, 1, 1)  # Project start date
         self.phases = {
@@ -21,362 +364,110 @@ class SentinelMVPRoadmap:
             "Phase 2": {"duration": 36, "color": "#45B7D1", "description": "Scale & Integration"},
             "Phase 3": {"duration": 24, "color": "#96CEB4", "description": "National Deployment"}
         }
+        self._phase_color_map = {phase: info["color"] for phase, info in self.phases.items()}
+        # Schedule math stays in integer weeks; this day-precision base is the only
+        # calendar value, used when week numbers are turned into plot dates
+        self._start_day = np.datetime64(self.start_date, 'D')
         
     def create_detailed_roadmap(self):
         """Create detailed MVP roadmap with milestones"""
+        return _ROADMAP_DATA
+    
+    def _week_dates(self, weeks):
+        """Convert 1-based project week numbers to datetime64[D] dates"""
+        return self._start_day + (weeks - 1).astype('m8[W]')
+    
+    @functools.cached_property
+    def gantt_columns(self):
+        """Parallel task/tick-label/phase/start/width columns for the GANTT bars"""
+        tasks, yticklabels, phases = [], [], []
         
-        roadmap_data = [
-            # Phase 0: Foundation & Pilot (Months 1-3)
-            {
-                "phase": "Phase 0",
-                "milestone": "Project Initiation",
-                "start_week": 1,
-                "duration_weeks": 2,
-                "owner": "PM",
-                "dependencies": [],
-                "deliverables": ["Project charter", "Team assembly", "Stakeholder alignment"],
-                "success_criteria": ["Team hired", "Budget approved", "Stakeholders aligned"]
-            },
-            {
-                "phase": "Phase 0",
-                "milestone": "Stakeholder Partnerships",
-                "start_week": 3,
-                "duration_weeks": 4,
-                "owner": "BD",
-                "dependencies": ["Project Initiation"],
-                "deliverables": ["Private security MoUs", "Bank partnerships", "Insurance agreements"],
-                "success_criteria": ["3+ security partners", "2+ bank partnerships", "2+ insurance partners"]
-            },
-            {
-                "phase": "Phase 0",
-                "milestone": "Technical Foundation",
-                "start_week": 1,
-                "duration_weeks": 8,
-                "owner": "Tech Lead",
-                "dependencies": [],
-                "deliverables": ["Infrastructure setup", "Database design", "API framework"],
-                "success_criteria": ["Cloud infrastructure ready", "Database deployed", "API endpoints functional"]
-            },
-            {
-                "phase": "Phase 0",
-                "milestone": "MVP ANPR System",
-                "start_week": 4,
-                "duration_weeks": 6,
-                "owner": "ML Engineer",
-                "dependencies": ["Technical Foundation"],
-                "deliverables": ["ANPR model training", "Edge deployment", "Real-time processing"],
-                "success_criteria": ["95%+ ANPR accuracy", "50ms inference time", "10+ edge devices deployed"]
-            },
-            {
-                "phase": "Phase 0",
-                "milestone": "Mobile App MVP",
-                "start_week": 6,
-                "duration_weeks": 8,
-                "owner": "Mobile Dev",
-                "dependencies": ["Technical Foundation"],
-                "deliverables": ["Android app", "iOS app", "Citizen reporting features"],
-                "success_criteria": ["App store approval", "1000+ downloads", "50+ daily active users"]
-            },
-            {
-                "phase": "Phase 0",
-                "milestone": "Pilot Deployment",
-                "start_week": 10,
-                "duration_weeks": 4,
-                "owner": "Ops Team",
-                "dependencies": ["MVP ANPR System", "Mobile App MVP", "Stakeholder Partnerships"],
-                "deliverables": ["Sandton CBD deployment", "User training", "Performance monitoring"],
-                "success_criteria": ["20+ edge devices active", "30% detection improvement", "User satisfaction >80%"]
-            },
-            
-            # Phase 1: Core Development (Months 4-9)
-            {
-                "phase": "Phase 1",
-                "milestone": "Advanced ML Models",
-                "start_week": 14,
-                "duration_weeks": 12,
-                "owner": "ML Engineer",
-                "dependencies": ["Pilot Deployment"],
-                "deliverables": ["Gunshot detection", "Weapon detection", "Behavioral analysis"],
-                "success_criteria": ["90%+ gunshot accuracy", "85%+ weapon detection", "Real-time processing"]
-            },
-            {
-                "phase": "Phase 1",
-                "milestone": "Threat Intelligence Integration",
-                "start_week": 16,
-                "duration_weeks": 10,
-                "owner": "Security Engineer",
-                "dependencies": ["Technical Foundation"],
-                "deliverables": ["Cyber threat feeds", "OSINT integration", "Threat correlation"],
-                "success_criteria": ["5+ threat feeds integrated", "Real-time correlation", "Automated alerts"]
-            },
-            {
-                "phase": "Phase 1",
-                "milestone": "Bank Integration",
-                "start_week": 18,
-                "duration_weeks": 8,
-                "owner": "Integration Engineer",
-                "dependencies": ["Stakeholder Partnerships"],
-                "deliverables": ["Fraud detection API", "Real-time alerts", "Cross-domain correlation"],
-                "success_criteria": ["2+ banks integrated", "Fraud detection working", "Response time <5min"]
-            },
-            {
-                "phase": "Phase 1",
-                "milestone": "Scale to 3 Cities",
-                "start_week": 20,
-                "duration_weeks": 16,
-                "owner": "Ops Team",
-                "dependencies": ["Advanced ML Models", "Threat Intelligence Integration"],
-                "deliverables": ["Cape Town deployment", "Durban deployment", "Performance optimization"],
-                "success_criteria": ["100+ edge devices", "3 cities active", "40% detection improvement"]
-            },
-            
-            # Phase 2: Scale & Integration (Months 10-21)
-            {
-                "phase": "Phase 2",
-                "milestone": "National Infrastructure",
-                "start_week": 36,
-                "duration_weeks": 20,
-                "owner": "Infrastructure Team",
-                "dependencies": ["Scale to 3 Cities"],
-                "deliverables": ["Multi-region deployment", "Load balancing", "Disaster recovery"],
-                "success_criteria": ["9 provinces covered", "99.9% uptime", "Auto-scaling working"]
-            },
-            {
-                "phase": "Phase 2",
-                "milestone": "Advanced Analytics",
-                "start_week": 40,
-                "duration_weeks": 16,
-                "owner": "Data Scientist",
-                "dependencies": ["National Infrastructure"],
-                "deliverables": ["Predictive analytics", "Crime forecasting", "Pattern recognition"],
-                "success_criteria": ["80%+ prediction accuracy", "Real-time forecasting", "Pattern detection"]
-            },
-            {
-                "phase": "Phase 2",
-                "milestone": "Law Enforcement Gateway",
-                "start_week": 44,
-                "duration_weeks": 12,
-                "owner": "Legal/Compliance",
-                "dependencies": ["Advanced Analytics"],
-                "deliverables": ["LE portal", "Audit trails", "Legal compliance"],
-                "success_criteria": ["Legal approval", "Audit compliance", "LE adoption"]
-            },
-            {
-                "phase": "Phase 2",
-                "milestone": "Full Ecosystem Integration",
-                "start_week": 48,
-                "duration_weeks": 20,
-                "owner": "Integration Team",
-                "dependencies": ["Law Enforcement Gateway"],
-                "deliverables": ["All banks integrated", "Insurance integration", "Government systems"],
-                "success_criteria": ["10+ banks", "5+ insurers", "Government approval"]
-            },
-            
-            # Phase 3: National Deployment (Months 22-30)
-            {
-                "phase": "Phase 3",
-                "milestone": "National Rollout",
-                "start_week": 68,
-                "duration_weeks": 24,
-                "owner": "Ops Team",
-                "dependencies": ["Full Ecosystem Integration"],
-                "deliverables": ["National deployment", "User training", "Support systems"],
-                "success_criteria": ["500+ edge devices", "50,000+ users", "45% crime reduction"]
-            }
-        ]
+        # One pass over the roadmap fills every label column, tick labels included
+        for item in _ROADMAP_DATA:
+            task = f"{item.milestone} ({item.phase})"
+            tasks.append(task)
+            yticklabels.append(f"{task} ({item.owner})")
+            phases.append(item.phase)
+        
+        # Widths stay timedelta64 so matplotlib converts them in the date units
+        # of the bar starts (a bare integer width would be read as days)
+        starts = self._week_dates(self._start_weeks)
+        widths = self._durations.astype('m8[W]')
         
-        return roadmap_data
+        return tasks, yticklabels, phases, starts, widths
     
-    def create_gantt_chart(self, roadmap_data):
+    def schedule_conflicts(self):
+        """Milestones planned to start before their dependencies can finish, with the earliest feasible week"""
+        earliest = _earliest_starts(self._durations, self._dep_indptr, self._dep_indices) + 1
+        return [
+            (item.milestone, int(week))
+            for item, week in zip(_ROADMAP_DATA, earliest)
+            if item.start_week < week
+        ]
+    
+    def create_gantt_chart(self):
         """Create GANTT chart visualization"""
+        # Plotting imports are deferred so the roadmap data is usable without them.
+        # The figure is built on an Agg canvas directly, bypassing pyplot's global
+        # figure manager, since charts are only saved to file, never shown.
+        import matplotlib.dates as mdates
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        from matplotlib.patches import Rectangle
         
-        # Prepare data for GANTT chart
-        gantt_data = []
-        for item in roadmap_data:
-            start_date = self.start_date + timedelta(weeks=item["start_week"] - 1)
-            end_date = start_date + timedelta(weeks=item["duration_weeks"])
-            
-            gantt_data.append({
-                "Task": f"{item['milestone']} ({item['phase']})",
-                "Start": start_date,
-                "Finish": end_date,
-                "Duration": item["duration_weeks"],
-                "Owner": item["owner"],
-                "Phase": item["phase"]
-            })
+        tasks, yticklabels, phases, starts, widths = self.gantt_columns
         
         # Create GANTT chart
-        fig, ax = plt.subplots(figsize=(16, 12))
+        fig = Figure(figsize=(16, 12), constrained_layout=True)
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
         
-        # Color mapping for phases
-        phase_colors = {
-            "Phase 0": "#FF6B6B",
-            "Phase 1": "#4ECDC4", 
-            "Phase 2": "#45B7D1",
-            "Phase 3": "#96CEB4"
-        }
+        phase_colors = self._phase_color_map
+        
+        # Plot all GANTT bars in one call
+        y = np.arange(len(tasks))
+        colors = [phase_colors[phase] for phase in phases]
         
-        # Plot GANTT bars
-        y_pos = 0
-        for i, task in enumerate(gantt_data):
-            start = task["Start"]
-            duration = task["Duration"]
-            end = task["Finish"]
-            
-            color = phase_colors.get(task["Phase"], "#CCCCCC")
-            
-            ax.barh(y_pos, duration, left=start, height=0.6, 
-                   color=color, alpha=0.8, edgecolor='black', linewidth=0.5)
-            
-            # Add task label
-            ax.text(start + timedelta(weeks=duration/2), y_pos, 
-                   task["Task"], ha='center', va='center', 
-                   fontsize=8, fontweight='bold')
-            
-            y_pos += 1
+        bars = ax.barh(y, widths, left=starts, height=0.6, 
+                      color=colors, alpha=0.8, edgecolor='black', linewidth=0.5)
+        
+        # Add task labels, centred on their bars
+        ax.bar_label(bars, labels=tasks, label_type='center', fontsize=8, fontweight='bold')
         
         # Customize chart
-        ax.set_yticks(range(len(gantt_data)))
-        ax.set_yticklabels([f"{task['Task']} ({task['Owner']})" for task in gantt_data])
+        ax.set_yticks(y)
+        ax.set_yticklabels(yticklabels)
         ax.set_xlabel('Timeline (Weeks)')
         ax.set_title('Sentinel MVP Product Roadmap - GANTT Chart', fontsize=16, fontweight='bold')
         
         # Format x-axis
         ax.xaxis.set_major_locator(mdates.MonthLocator(interval=2))
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-        plt.xticks(rotation=45)
+        ax.tick_params(axis='x', labelrotation=45)
         
         # Add phase legend
-        legend_elements = [plt.Rectangle((0,0),1,1, facecolor=color, alpha=0.8, label=phase) 
+        legend_elements = [Rectangle((0,0),1,1, facecolor=color, alpha=0.8, label=phase) 
                           for phase, color in phase_colors.items()]
         ax.legend(handles=legend_elements, loc='upper right')
         
         # Add milestone markers
-        milestone_weeks = [12, 24, 36, 48, 68, 92]  # Key milestone weeks
-        for week in milestone_weeks:
-            milestone_date = self.start_date + timedelta(weeks=week-1)
-            ax.axvline(x=milestone_date, color='red', linestyle='--', alpha=0.7)
-            ax.text(milestone_date, len(gantt_data)-0.5, f'Week {week}', 
+        milestone_weeks = np.array([12, 24, 36, 48, 68, 92])  # Key milestone weeks
+        milestone_dates = self._week_dates(milestone_weeks)
+        ax.vlines(milestone_dates, 0, 1, transform=ax.get_xaxis_transform(), 
+                 color='red', linestyle='--', alpha=0.7)
+        for week, milestone_date in zip(milestone_weeks, milestone_dates):
+            ax.text(milestone_date, len(tasks)-0.5, f'Week {week}', 
                    rotation=90, ha='right', va='top', fontsize=8, color='red')
         
-        plt.tight_layout()
         return fig
     
     def create_milestone_timeline(self, roadmap_data):
         """Create milestone timeline with key deliverables"""
-        
-        milestones = [
-            {
-                "week": 12,
-                "milestone": "Phase 0 Complete",
-                "description": "Pilot deployment in Sandton CBD",
-                "key_metrics": ["20+ edge devices", "30% detection improvement", "1000+ app users"],
-                "deliverables": ["MVP ANPR system", "Mobile app", "Basic dashboard"]
-            },
-            {
-                "week": 24,
-                "milestone": "Phase 1 Complete", 
-                "description": "3 cities deployed with advanced features",
-                "key_metrics": ["100+ edge devices", "40% detection improvement", "10,000+ users"],
-                "deliverables": ["Gunshot detection", "Threat intelligence", "Bank integration"]
-            },
-            {
-                "week": 36,
-                "milestone": "Phase 2 Complete",
-                "description": "National infrastructure with full integration",
-                "key_metrics": ["300+ edge devices", "45% detection improvement", "25,000+ users"],
-                "deliverables": ["National infrastructure", "Advanced analytics", "LE gateway"]
-            },
-            {
-                "week": 48,
-                "milestone": "Full Ecosystem",
-                "description": "Complete integration with all partners",
-                "key_metrics": ["500+ edge devices", "50% detection improvement", "50,000+ users"],
-                "deliverables": ["All banks integrated", "Insurance integration", "Government systems"]
-            },
-            {
-                "week": 68,
-                "milestone": "National Deployment",
-                "description": "Full national rollout complete",
-                "key_metrics": ["1000+ edge devices", "55% detection improvement", "100,000+ users"],
-                "deliverables": ["National coverage", "Full ecosystem", "Operational excellence"]
-            }
-        ]
-        
-        return milestones
+        return _MILESTONE_TIMELINE
     
     def create_resource_plan(self):
         """Create resource allocation plan"""
-        
-        resources = {
-            "Phase 0": {
-                "team_size": 8,
-                "roles": {
-                    "Product Manager": 1,
-                    "Tech Lead": 1,
-                    "ML Engineer": 1,
-                    "Backend Developer": 2,
-                    "Mobile Developer": 1,
-                    "DevOps Engineer": 1,
-                    "Business Development": 1
-                },
-                "budget": 2500000,  # R2.5M
-                "duration_weeks": 12
-            },
-            "Phase 1": {
-                "team_size": 12,
-                "roles": {
-                    "Product Manager": 1,
-                    "Tech Lead": 1,
-                    "ML Engineer": 2,
-                    "Backend Developer": 3,
-                    "Frontend Developer": 1,
-                    "Mobile Developer": 1,
-                    "DevOps Engineer": 1,
-                    "Security Engineer": 1,
-                    "Business Development": 1
-                },
-                "budget": 5000000,  # R5M
-                "duration_weeks": 24
-            },
-            "Phase 2": {
-                "team_size": 18,
-                "roles": {
-                    "Product Manager": 1,
-                    "Tech Lead": 1,
-                    "ML Engineer": 3,
-                    "Backend Developer": 4,
-                    "Frontend Developer": 2,
-                    "Mobile Developer": 1,
-                    "DevOps Engineer": 2,
-                    "Security Engineer": 2,
-                    "Data Scientist": 1,
-                    "Legal/Compliance": 1
-                },
-                "budget": 10000000,  # R10M
-                "duration_weeks": 36
-            },
-            "Phase 3": {
-                "team_size": 25,
-                "roles": {
-                    "Product Manager": 2,
-                    "Tech Lead": 2,
-                    "ML Engineer": 4,
-                    "Backend Developer": 6,
-                    "Frontend Developer": 3,
-                    "Mobile Developer": 2,
-                    "DevOps Engineer": 3,
-                    "Security Engineer": 2,
-                    "Data Scientist": 2,
-                    "Legal/Compliance": 1,
-                    "Support Engineer": 2
-                },
-                "budget": 15000000,  # R15M
-                "duration_weeks": 24
-            }
-        }
-        
-        return resources
+        return _RESOURCES
     
     def generate_roadmap_report(self):
         """Generate comprehensive roadmap report"""
@@ -385,13 +476,18 @@ class SentinelMVPRoadmap:
         milestones = self.create_milestone_timeline(roadmap_data)
         resources = self.create_resource_plan()
         
-        # Create GANTT chart
-        fig = self.create_gantt_chart(roadmap_data)
+        # Create GANTT chart, rendering only when its inputs have not been seen
+        key = _chart_key(roadmap_data, self.start_date, self._phase_color_map)
+        png = _PNG_CACHE.get(key)
+        if png is None:
+            fig = self.create_gantt_chart()
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format='png', dpi=150)
+            png = _PNG_CACHE[key] = buffer.getvalue()
         
         # Save GANTT chart
         gantt_file = Path("real_data/sentinel_mvp_gantt_chart.png")
-        fig.savefig(gantt_file, dpi=300, bbox_inches='tight')
-        plt.close(fig)
+        _write_atomic(gantt_file, png)
         
         # Create comprehensive report
         report = {
@@ -404,9 +500,9 @@ class SentinelMVPRoadmap:
                 "end_date": (self.start_date + timedelta(weeks=92)).isoformat()
             },
             "phases": self.phases,
-            "roadmap": roadmap_data,
+            "roadmap": [asdict(item) for item in roadmap_data],
             "milestones": milestones,
-            "resources": resources,
+            "resources": dict(resources),
             "risk_mitigation": {
                 "technical_risks": [
                     "ML model accuracy below target - Mitigation: Extended training, data augmentation",
@@ -450,8 +546,11 @@ class SentinelMVPRoadmap:
         
         # Save report
         report_file = Path("real_data/sentinel_mvp_roadmap_report.json")
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        if orjson is not None:
+            data = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(report, indent=2, default=str).encode()
+        _write_atomic(report_file, data)
         
         return report, gantt_file
 
@@ -13,36 +13,264 @@ import json
 import sqlite3
 from datetime import datetime, timedelta
 import numpy as np
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 import logging
+import threading
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Above this many hotspots the map shows grid-binned markers instead of raw points
+MAP_POINT_LIMIT = 2000
+
+# Chart styling built once at import; figures copy these on assignment
+PRIORITY_COLORS = MappingProxyType({
+    'critical': '#FF0000',
+    'high': '#FF6600',
+    'medium': '#FFCC00',
+    'low': '#00CC00'
+})
+SEVERITY_CBAR = go.layout.coloraxis.ColorBar(
+    title="Severity Score",
+    tickvals=[0, 2, 4, 6, 8, 10],
+    ticktext=['Low', 'Low-Med', 'Medium', 'Med-High', 'High', 'Critical']
+)
+
+# Sidebar priority filter options
+PRIORITY_OPTIONS = ('All', 'critical', 'high', 'medium', 'low')
+
+# Dashboard sections in display order, mapped to the method that renders each one
+SECTIONS = {
+    "Hotspots": "create_crime_hotspots_map",
+    "Crime Stats": "create_crime_statistics_charts",
+    "Vehicles": "create_vehicle_crime_analysis",
+    "CIT": "create_cit_analysis",
+    "Deployments": "create_deployment_recommendations",
+    "Security": "create_private_security_analysis",
+    "Trends": "create_trend_analysis"
+}
+
+# Columns each table contributes to the dashboard; everything else stays in SQLite
+HOTSPOT_COLS = ('name', 'province', 'crime_type', 'incident_count', 'severity_score',
+                'latitude', 'longitude', 'sentinel_priority')
+VEHICLE_COLS = ('vehicle_make', 'vehicle_model', 'crime_type', 'theft_count', 'hijacking_count',
+                'anpr_priority')
+CIT_COLS = ('route_name', 'start_lat', 'start_lon', 'end_lat', 'end_lon', 'risk_level',
+            'historical_incidents', 'priority_score')
+PARTNER_COLS = ('company_name', 'officer_count', 'partnership_tier')
+DEPLOY_COLS = ('location_name', 'latitude', 'longitude', 'priority', 'expected_incidents_per_month',
+               'deployment_type', 'status')
+
+# Low-cardinality labels stored as categoricals and measures narrowed after load
+CATEGORY_COLS = ('province', 'crime_type', 'sentinel_priority', 'priority', 'risk_level', 'partnership_tier',
+                 'vehicle_make', 'vehicle_model', 'anpr_priority', 'deployment_type', 'status')
+FLOAT_COLS = ('latitude', 'longitude', 'severity_score', 'priority_score',
+              'start_lat', 'start_lon', 'end_lat', 'end_lon')
+INT_COLS = ('incident_count', 'theft_count', 'hijacking_count', 'historical_incidents', 'officer_count',
+            'expected_incidents_per_month')
+
+@dataclass
+class HotspotAggregates:
+    """Data class for the hotspot summaries shared by the KPI, statistics and trend sections"""
+    province_agg: pd.DataFrame
+    crime_type_agg: pd.DataFrame
+    priority_counts: pd.Series
+    critical_count: int
+
+def _compute_hotspot_aggs(hotspots: pd.DataFrame) -> HotspotAggregates:
+    """Aggregate hotspots once at the finest grouping and derive every marginal from that small result"""
+    fine = hotspots.groupby(['province', 'crime_type', 'sentinel_priority'], observed=True, sort=False).agg(
+        incident_count=('incident_count', 'sum'),
+        severity_total=('severity_score', 'sum'),
+        hotspot_count=('severity_score', 'size')
+    )
+    
+    by_province = fine.groupby(level='province', observed=True).sum()
+    province_agg = pd.DataFrame({
+        'incident_count': by_province['incident_count'],
+        'severity_score': by_province['severity_total'] / by_province['hotspot_count']
+    }).reset_index()
+    
+    crime_type_agg = (
+        fine['incident_count'].groupby(level='crime_type', observed=True).sum()
+        .reset_index().sort_values('incident_count', ascending=False)
+    )
+    
+    priority_counts = fine['hotspot_count'].groupby(level='sentinel_priority', observed=True, sort=False).sum()
+    return HotspotAggregates(
+        province_agg=province_agg,
+        crime_type_agg=crime_type_agg,
+        priority_counts=priority_counts,
+        critical_count=int(priority_counts.get('critical', 0))
+    )
+
+def _compact(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert repeated labels to categoricals and downcast numeric measures in place"""
+    for column in df.columns.intersection(CATEGORY_COLS):
+        df[column] = df[column].astype('category')
+    for column in df.columns.intersection(FLOAT_COLS):
+        df[column] = pd.to_numeric(df[column], downcast='float')
+    for column in df.columns.intersection(INT_COLS):
+        df[column] = pd.to_numeric(df[column], downcast='integer')
+    return df
+
+# Read-side tuning: 256MB memory map, 64MB page cache, temp b-trees kept in memory
+READ_PRAGMAS = (
+    "PRAGMA query_only=1",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY"
+)
+
+@st.cache_resource(show_spinner=False)
+def _shared_connection(db_path: str):
+    """One read-only connection per database for every session, with the lock that serialises its use"""
+    conn = sqlite3.connect(Path(db_path).resolve().as_uri() + "?mode=ro", uri=True, check_same_thread=False)
+    for pragma in READ_PRAGMAS:
+        conn.execute(pragma)
+    return conn, threading.Lock()
+
+def _select(table: str, columns) -> str:
+    """SELECT statement for just the given columns of a table"""
+    return f"SELECT {', '.join(columns)} FROM {table}"
+
+def _top_vehicles(conn: sqlite3.Connection, kind: str, n: int = 10) -> pd.DataFrame:
+    """The n vehicles with the most incidents of one crime type ('theft' or 'hijacking')"""
+    count_column = {'theft': 'theft_count', 'hijacking': 'hijacking_count'}[kind]
+    # rowid breaks ties in table order, as nlargest did
+    query = (_select('vehicle_crime_patterns', VEHICLE_COLS)
+             + f" WHERE crime_type = ? ORDER BY {count_column} DESC, rowid LIMIT ?")
+    return pd.read_sql_query(query, conn, params=[kind, n])
+
+def _top_partners(conn: sqlite3.Connection, n: int = 10) -> pd.DataFrame:
+    """The n security partners with the most officers"""
+    query = _select('private_security_partners', PARTNER_COLS) + " ORDER BY officer_count DESC, rowid LIMIT ?"
+    return pd.read_sql_query(query, conn, params=[n])
+
+def _where(conditions):
+    """Build a WHERE clause and its bound parameters from (column, value) pairs, skipping 'All'"""
+    conditions = [(column, value) for column, value in conditions if value != 'All']
+    if not conditions:
+        return "", []
+    clause = " WHERE " + " AND ".join(f"{column} = ?" for column, _ in conditions)
+    return clause, [value for _, value in conditions]
+
+# Shared rather than copied per rerun: the tuple is immutable. Every database
+# write starts a new mtime key, so only the last few versions are kept
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _load_provinces(db_path: str, mtime: float) -> tuple:
+    """Distinct hotspot provinces for the sidebar filter, sorted"""
+    conn, lock = _shared_connection(db_path)
+    with lock:
+        return tuple(row[0] for row in conn.execute("SELECT DISTINCT province FROM crime_hotspots ORDER BY province"))
+
+# One entry per filter combination and database version; bounded so frames
+# from superseded versions are evicted instead of living for the process
+@st.cache_data(show_spinner=False, max_entries=64)
+def _load_data(db_path: str, mtime: float, province: str = 'All', priority: str = 'All'):
+    """Read the dashboard tables with the sidebar filters applied in SQL; cached per filter combination"""
+    conn, lock = _shared_connection(db_path)
+    
+    hotspot_where, hotspot_params = _where([('province', province), ('sentinel_priority', priority)])
+    deployment_where, deployment_params = _where([('priority', priority)])
+    
+    # Load all tables
+    with lock:
+        data = {
+            'hotspots': pd.read_sql_query(_select('crime_hotspots', HOTSPOT_COLS) + hotspot_where, conn, params=hotspot_params),
+            'vehicles': pd.read_sql_query(_select('vehicle_crime_patterns', VEHICLE_COLS), conn),
+            'cit_routes': pd.read_sql_query(_select('cit_routes', CIT_COLS), conn),
+            'partners': pd.read_sql_query(_select('private_security_partners', PARTNER_COLS), conn),
+            'deployments': pd.read_sql_query(_select('sentinel_deployments', DEPLOY_COLS) + deployment_where, conn, params=deployment_params),
+            'top_theft': _top_vehicles(conn, 'theft'),
+            'top_hijacking': _top_vehicles(conn, 'hijacking'),
+            'top_partners': _top_partners(conn)
+        }
+    
+    for frame in data.values():
+        _compact(frame)
+    
+    # Computed here so the summaries are cached alongside the filtered frames
+    data['hotspot_aggs'] = _compute_hotspot_aggs(data['hotspots'])
+    data['priority_counts'] = {
+        'hotspots': data['hotspot_aggs'].priority_counts,
+        'vehicles': data['vehicles']['anpr_priority'].value_counts(),
+        'deployments': data['deployments']['priority'].value_counts()
+    }
+    return data
+
+def _bin_hotspots(hotspots: pd.DataFrame, decimals: int = 1) -> pd.DataFrame:
+    """Aggregate hotspots onto a lat/lon grid (0.1 degree by default) to bound the marker count"""
+    grid = hotspots.assign(
+        latitude=hotspots['latitude'].round(decimals),
+        longitude=hotspots['longitude'].round(decimals)
+    )
+    return grid.groupby(['latitude', 'longitude'], as_index=False, sort=False).agg(
+        name=('name', 'first'),
+        province=('province', 'first'),
+        crime_type=('crime_type', 'first'),
+        incident_count=('incident_count', 'sum'),
+        severity_score=('severity_score', 'mean'),
+        sentinel_priority=('sentinel_priority', 'first')
+    )
+
+@st.cache_data(show_spinner=False)
+def _trend_frame(seed: int = 0) -> pd.DataFrame:
+    """Simulated monthly crime trends, seeded so every rerun sees the same series"""
+    # In a real implementation this would come from time-series data
+    rng = np.random.default_rng(seed)
+    months = pd.date_range(start='2023-01-01', end='2024-01-01', freq='M')
+    return pd.DataFrame({
+        'month': months,
+        'total_crimes': rng.integers(1000, 2000, len(months)),
+        'vehicle_crimes': rng.integers(200, 400, len(months)),
+        'cit_robberies': rng.integers(10, 30, len(months))
+    })
+
 class SentinelDashboard:
     def __init__(self, data_dir: str = "real_data"):
         self.data_dir = Path(data_dir)
         self.db_path = self.data_dir / "sentinel_integrated.db"
         
-    def load_data(self):
-        """Load data from the integrated database"""
+    def _db_state(self):
+        """Database path and mtime used as cache keys, or None if the database is missing"""
         if not self.db_path.exists():
             st.error(f"Database not found: {self.db_path}")
             return None
         
-        conn = sqlite3.connect(self.db_path)
+        # A rewritten database gets a new mtime and therefore fresh cache entries;
+        # in WAL mode recent commits touch the -wal file before the database itself
+        wal_path = self.db_path.with_name(self.db_path.name + "-wal")
+        mtime = self.db_path.stat().st_mtime
+        if wal_path.exists():
+            mtime = max(mtime, wal_path.stat().st_mtime)
+        return str(self.db_path), mtime
+    
+    def load_provinces(self):
+        """Load the provinces available for filtering"""
+        db_state = self._db_state()
+        if db_state is None:
+            return None
+        return _load_provinces(*db_state)
+    
+    def load_data(self, province: str = 'All', priority: str = 'All'):
+        """Load data from the integrated database, filtered by province and priority"""
+        db_state = self._db_state()
+        if db_state is None:
+            return None
         
-        # Load all tables
-        data = {
-            'hotspots': pd.read_sql("SELECT * FROM crime_hotspots", conn),
-            'vehicles': pd.read_sql("SELECT * FROM vehicle_crime_patterns", conn),
-            'cit_routes': pd.read_sql("SELECT * FROM cit_routes", conn),
-            'partners': pd.read_sql("SELECT * FROM private_security_partners", conn),
-            'deployments': pd.read_sql("SELECT * FROM sentinel_deployments", conn)
-        }
+        # Reruns with unchanged filters reuse this session's frames instead of
+        # unpickling a fresh copy out of st.cache_data
+        key = (*db_state, province, priority)
+        cached = st.session_state.get('dashboard_data')
+        if cached is not None and cached[0] == key:
+            return cached[1]
         
-        conn.close()
+        data = _load_data(*key)
+        st.session_state['dashboard_data'] = (key, data)
         return data
     
     def create_crime_hotspots_map(self, data):
@@ -53,9 +281,13 @@ class SentinelDashboard:
             st.warning("No hotspot data available")
             return
         
+        hotspots = data['hotspots']
+        if len(hotspots) > MAP_POINT_LIMIT:
+            hotspots = _bin_hotspots(hotspots)
+        
         # Create map
         fig = px.scatter_mapbox(
-            data['hotspots'],
+            hotspots,
             lat='latitude',
             lon='longitude',
             color='severity_score',
@@ -77,11 +309,7 @@ class SentinelDashboard:
         fig.update_layout(
             mapbox_style="open-street-map",
             title="Crime Hotspots by Severity Score",
-            coloraxis_colorbar=dict(
-                title="Severity Score",
-                tickvals=[0, 2, 4, 6, 8, 10],
-                ticktext=['Low', 'Low-Med', 'Medium', 'Med-High', 'High', 'Critical']
-            )
+            coloraxis_colorbar=SEVERITY_CBAR
         )
         
         st.plotly_chart(fig, use_container_width=True)
@@ -90,40 +318,38 @@ class SentinelDashboard:
         """Create crime statistics charts"""
         st.subheader("Crime Statistics Analysis")
         
-        # Province-wise crime distribution
-        col1, col2 = st.columns(2)
+        province_data = data['hotspot_aggs'].province_agg
+        crime_type_data = data['hotspot_aggs'].crime_type_agg.head(10)
         
-        with col1:
-            st.write("**Crime Distribution by Province**")
-            province_data = data['hotspots'].groupby('province').agg({
-                'incident_count': 'sum',
-                'severity_score': 'mean'
-            }).reset_index()
-            
-            fig = px.bar(
-                province_data,
-                x='province',
-                y='incident_count',
-                title='Total Incidents by Province',
-                color='severity_score',
-                color_continuous_scale='Reds'
-            )
-            fig.update_xaxes(tickangle=45)
-            st.plotly_chart(fig, use_container_width=True)
+        # Province-wise crime distribution and crime types share one figure
+        fig = make_subplots(
+            rows=1, cols=2,
+            subplot_titles=('Total Incidents by Province', 'Top 10 Crime Types'),
+            specs=[[{"type": "bar"}, {"type": "pie"}]]
+        )
         
-        with col2:
-            st.write("**Crime Types Distribution**")
-            crime_type_data = data['hotspots'].groupby('crime_type').agg({
-                'incident_count': 'sum'
-            }).reset_index().sort_values('incident_count', ascending=False)
-            
-            fig = px.pie(
-                crime_type_data.head(10),
-                values='incident_count',
-                names='crime_type',
-                title='Top 10 Crime Types'
-            )
-            st.plotly_chart(fig, use_container_width=True)
+        fig.add_trace(
+            go.Bar(
+                x=province_data['province'],
+                y=province_data['incident_count'],
+                marker=dict(
+                    color=province_data['severity_score'],
+                    colorscale='Reds',
+                    colorbar=dict(title='Severity Score', x=0.45)
+                ),
+                name='Incidents',
+                showlegend=False
+            ),
+            row=1, col=1
+        )
+        
+        fig.add_trace(
+            go.Pie(values=crime_type_data['incident_count'], labels=crime_type_data['crime_type'], name='Crime Types'),
+            row=1, col=2
+        )
+        
+        fig.update_xaxes(tickangle=45, row=1, col=1)
+        st.plotly_chart(fig, use_container_width=True)
     
     def create_vehicle_crime_analysis(self, data):
         """Create vehicle crime analysis charts"""
@@ -133,37 +359,41 @@ class SentinelDashboard:
             st.warning("No vehicle crime data available")
             return
         
-        col1, col2 = st.columns(2)
+        panels = (
+            (data['top_theft'], 'theft_count', 'Theft Count'),
+            (data['top_hijacking'], 'hijacking_count', 'Hijacking Count')
+        )
         
-        with col1:
-            st.write("**Most Stolen Vehicles**")
-            theft_data = data['vehicles'][data['vehicles']['crime_type'] == 'theft'].nlargest(10, 'theft_count')
-            
-            fig = px.bar(
-                theft_data,
-                x='vehicle_model',
-                y='theft_count',
-                color='vehicle_make',
-                title='Top 10 Most Stolen Vehicles',
-                labels={'vehicle_model': 'Vehicle Model', 'theft_count': 'Theft Count'}
-            )
-            fig.update_xaxes(tickangle=45)
-            st.plotly_chart(fig, use_container_width=True)
+        # Most stolen and most hijacked vehicles side by side in one figure
+        fig = make_subplots(
+            rows=1, cols=2,
+            subplot_titles=('Top 10 Most Stolen Vehicles', 'Top 10 Most Hijacked Vehicles')
+        )
         
-        with col2:
-            st.write("**Most Hijacked Vehicles**")
-            hijack_data = data['vehicles'][data['vehicles']['crime_type'] == 'hijacking'].nlargest(10, 'hijacking_count')
-            
-            fig = px.bar(
-                hijack_data,
-                x='vehicle_model',
-                y='hijacking_count',
-                color='vehicle_make',
-                title='Top 10 Most Hijacked Vehicles',
-                labels={'vehicle_model': 'Vehicle Model', 'hijacking_count': 'Hijacking Count'}
-            )
-            fig.update_xaxes(tickangle=45)
-            st.plotly_chart(fig, use_container_width=True)
+        # One trace per make in each panel; a make keeps its colour and legend entry across both
+        palette = px.colors.qualitative.Plotly
+        make_colors = {}
+        for col, (vehicles, count_column, count_label) in enumerate(panels, start=1):
+            for make, group in vehicles.groupby('vehicle_make', observed=True, sort=False):
+                first_seen = make not in make_colors
+                if first_seen:
+                    make_colors[make] = palette[len(make_colors) % len(palette)]
+                fig.add_trace(
+                    go.Bar(
+                        x=group['vehicle_model'],
+                        y=group[count_column],
+                        name=make,
+                        legendgroup=make,
+                        showlegend=first_seen,
+                        marker_color=make_colors[make]
+                    ),
+                    row=1, col=col
+                )
+            fig.update_xaxes(title_text='Vehicle Model', tickangle=45, row=1, col=col)
+            fig.update_yaxes(title_text=count_label, row=1, col=col)
+        
+        fig.update_layout(barmode='relative', legend_title_text='Vehicle Make')
+        st.plotly_chart(fig, use_container_width=True)
     
     def create_cit_analysis(self, data):
         """Create CIT (Cash-in-Transit) analysis"""
@@ -177,7 +407,7 @@ class SentinelDashboard:
         
         with col1:
             st.write("**CIT Route Risk Levels**")
-            risk_data = data['cit_routes'].groupby('risk_level').agg({
+            risk_data = data['cit_routes'].groupby('risk_level', observed=True).agg({
                 'historical_incidents': 'sum',
                 'priority_score': 'mean'
             }).reset_index()
@@ -195,17 +425,40 @@ class SentinelDashboard:
         
         with col2:
             st.write("**CIT Routes Map**")
-            fig = go.Figure()
+            routes = data['cit_routes']
+            n = len(routes)
+            
+            # All segments go in one trace: start, end, then a NaN gap per route
+            line_lons = np.full(3 * n, np.nan)
+            line_lats = np.full(3 * n, np.nan)
+            line_lons[0::3], line_lons[1::3] = routes['start_lon'], routes['end_lon']
+            line_lats[0::3], line_lats[1::3] = routes['start_lat'], routes['end_lat']
             
-            for _, route in data['cit_routes'].iterrows():
-                fig.add_trace(go.Scattermapbox(
-                    mode="lines+markers",
-                    lon=[route['start_lon'], route['end_lon']],
-                    lat=[route['start_lat'], route['end_lat']],
-                    marker={'size': 10, 'color': 'red' if route['risk_level'] == 'high' else 'orange'},
-                    name=f"{route['route_name']} ({route['risk_level']})",
-                    text=f"Incidents: {route['historical_incidents']}<br>Priority: {route['priority_score']:.2f}"
-                ))
+            # Endpoints share one marker trace, coloured by the route's risk level
+            colors = np.where(routes['risk_level'] == 'high', 'red', 'orange')
+            hover = (
+                routes['route_name'] + " (" + routes['risk_level'].astype(str) + ")<br>Incidents: "
+                + routes['historical_incidents'].astype(str)
+                + "<br>Priority: " + routes['priority_score'].map('{:.2f}'.format)
+            ).to_numpy()
+            
+            fig = go.Figure([
+                go.Scattermapbox(
+                    mode="lines",
+                    lon=line_lons,
+                    lat=line_lats,
+                    hoverinfo='skip',
+                    name="CIT routes"
+                ),
+                go.Scattermapbox(
+                    mode="markers",
+                    lon=np.concatenate([routes['start_lon'], routes['end_lon']]),
+                    lat=np.concatenate([routes['start_lat'], routes['end_lat']]),
+                    marker={'size': 10, 'color': np.tile(colors, 2)},
+                    text=np.tile(hover, 2),
+                    name="Route endpoints"
+                )
+            ])
             
             fig.update_layout(
                 mapbox_style="open-street-map",
@@ -229,19 +482,14 @@ class SentinelDashboard:
         
         with col1:
             st.write("**Deployment Priority Distribution**")
-            priority_data = data['deployments'].groupby('priority').size().reset_index(name='count')
+            priority_data = data['priority_counts']['deployments'].sort_index().rename_axis('priority').reset_index(name='count')
             
             fig = px.pie(
                 priority_data,
                 values='count',
                 names='priority',
                 title='Deployments by Priority Level',
-                color_discrete_map={
-                    'critical': '#FF0000',
-                    'high': '#FF6600',
-                    'medium': '#FFCC00',
-                    'low': '#00CC00'
-                }
+                color_discrete_map=PRIORITY_COLORS
             )
             st.plotly_chart(fig, use_container_width=True)
         
@@ -254,6 +502,7 @@ class SentinelDashboard:
                 color='deployment_type',
                 size='expected_incidents_per_month',
                 hover_name='location_name',
+                render_mode='webgl',
                 title='Expected Incidents vs Deployment Priority',
                 labels={
                     'expected_incidents_per_month': 'Expected Incidents/Month',
@@ -276,12 +525,7 @@ class SentinelDashboard:
                 'expected_incidents_per_month': True,
                 'status': True
             },
-            color_discrete_map={
-                'critical': '#FF0000',
-                'high': '#FF6600',
-                'medium': '#FFCC00',
-                'low': '#00CC00'
-            },
+            color_discrete_map=PRIORITY_COLORS,
             zoom=6,
             height=500
         )
@@ -305,7 +549,7 @@ class SentinelDashboard:
         
         with col1:
             st.write("**Partnership Tiers Distribution**")
-            tier_data = data['partners'].groupby('partnership_tier').agg({
+            tier_data = data['partners'].groupby('partnership_tier', observed=True).agg({
                 'officer_count': 'sum'
             }).reset_index()
             
@@ -320,7 +564,7 @@ class SentinelDashboard:
         
         with col2:
             st.write("**Top Security Companies by Officer Count**")
-            top_companies = data['partners'].nlargest(10, 'officer_count')
+            top_companies = data['top_partners']
             
             fig = px.bar(
                 top_companies,
@@ -338,11 +582,11 @@ class SentinelDashboard:
         
         # Calculate KPIs
         total_hotspots = len(data['hotspots'])
-        critical_hotspots = len(data['hotspots'][data['hotspots']['sentinel_priority'] == 'critical'])
+        critical_hotspots = data['hotspot_aggs'].critical_count
         total_vehicles = len(data['vehicles'])
-        high_risk_vehicles = len(data['vehicles'][data['vehicles']['anpr_priority'] == 'critical'])
+        high_risk_vehicles = data['priority_counts']['vehicles'].get('critical', 0)
         total_deployments = len(data['deployments'])
-        critical_deployments = len(data['deployments'][data['deployments']['priority'] == 'critical'])
+        critical_deployments = data['priority_counts']['deployments'].get('critical', 0)
         total_partners = len(data['partners'])
         
         # Display KPIs in columns
@@ -380,14 +624,8 @@ class SentinelDashboard:
         """Create trend analysis charts"""
         st.subheader("Crime Trend Analysis")
         
-        # Simulate monthly trends (in real implementation, this would come from time-series data)
-        months = pd.date_range(start='2023-01-01', end='2024-01-01', freq='M')
-        crime_trends = pd.DataFrame({
-            'month': months,
-            'total_crimes': np.random.randint(1000, 2000, len(months)),
-            'vehicle_crimes': np.random.randint(200, 400, len(months)),
-            'cit_robberies': np.random.randint(10, 30, len(months))
-        })
+        # Simulated monthly trends, generated once and cached
+        crime_trends = _trend_frame()
         
         fig = make_subplots(
             rows=2, cols=2,
@@ -416,7 +654,7 @@ class SentinelDashboard:
         
         # Crime rate by province
         if not data['hotspots'].empty:
-            province_crime_rate = data['hotspots'].groupby('province')['incident_count'].sum().reset_index()
+            province_crime_rate = data['hotspot_aggs'].province_agg
             fig.add_trace(
                 go.Bar(x=province_crime_rate['province'], y=province_crime_rate['incident_count'], name='Crime Rate'),
                 row=2, col=2
@@ -425,6 +663,12 @@ class SentinelDashboard:
         fig.update_layout(height=600, showlegend=False, title_text="Crime Trend Analysis")
         st.plotly_chart(fig, use_container_width=True)
     
+    @st.fragment
+    def render_section(self, data):
+        """Render only the selected section; switching sections reruns just this fragment"""
+        section = st.radio("Section", list(SECTIONS), horizontal=True, label_visibility="collapsed")
+        getattr(self, SECTIONS[section])(data)
+    
     def run_dashboard(self):
         """Run the complete dashboard"""
         st.set_page_config(
@@ -437,53 +681,35 @@ class SentinelDashboard:
         st.title("🛡️ Sentinel Crime Analysis Dashboard")
         st.markdown("Real-time crime data analysis and Sentinel deployment insights")
         
-        # Load data
-        data = self.load_data()
-        if data is None:
+        if st.sidebar.button("Refresh data"):
+            _load_provinces.clear()
+            _load_data.clear()
+            st.session_state.pop('dashboard_data', None)
+        provinces = self.load_provinces()
+        if provinces is None:
             return
         
         # Sidebar filters
         st.sidebar.header("Filters")
         
         # Province filter
-        if not data['hotspots'].empty:
-            provinces = ['All'] + list(data['hotspots']['province'].unique())
-            selected_province = st.sidebar.selectbox("Select Province", provinces)
-            
-            if selected_province != 'All':
-                data['hotspots'] = data['hotspots'][data['hotspots']['province'] == selected_province]
+        selected_province = 'All'
+        if provinces:
+            selected_province = st.sidebar.selectbox("Select Province", ('All',) + provinces)
         
         # Priority filter
-        priorities = ['All', 'critical', 'high', 'medium', 'low']
-        selected_priority = st.sidebar.selectbox("Select Priority", priorities)
+        selected_priority = st.sidebar.selectbox("Select Priority", PRIORITY_OPTIONS)
         
-        if selected_priority != 'All':
-            data['hotspots'] = data['hotspots'][data['hotspots']['sentinel_priority'] == selected_priority]
-            data['deployments'] = data['deployments'][data['deployments']['priority'] == selected_priority]
+        # Load data with the filters applied in the queries
+        data = self.load_data(selected_province, selected_priority)
+        if data is None:
+            return
         
         # Main dashboard sections
         self.create_kpi_dashboard(data)
         st.divider()
         
-        self.create_crime_hotspots_map(data)
-        st.divider()
-        
-        self.create_crime_statistics_charts(data)
-        st.divider()
-        
-        self.create_vehicle_crime_analysis(data)
-        st.divider()
-        
-        self.create_cit_analysis(data)
-        st.divider()
-        
-        self.create_deployment_recommendations(data)
-        st.divider()
-        
-        self.create_private_security_analysis(data)
-        st.divider()
-        
-        self.create_trend_analysis(data)
+        self.render_section(data)
         
         # Footer
         st.markdown("---")
@@ -6,15 +6,15 @@ Comprehensive web application with role-based dashboards
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import numpy as np
 import plotly.graph_objects as go
-import json
 import sqlite3
-from datetime import datetime, timedelta
-import requests
-import os
+import threading
 from pathlib import Path
-import base64
+import hashlib
+import hmac
+import secrets
+from types import MappingProxyType
 
 # Configure Streamlit
 st.set_page_config(
@@ -24,26 +24,473 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Just what the public showcase renders, so reads skip the rest of the table
+TOP_CRIMES_QUERY = "SELECT subcategory, total FROM crime_statistics ORDER BY total DESC LIMIT 10"
+
+# Read-side tuning: 256MB memory map, 64MB page cache
+CONNECTION_PRAGMAS = (
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536"
+)
+
+@st.cache_resource(show_spinner=False)
+def _get_conn(db_path: str):
+    """One read-only connection per database for every session, with the lock that serialises its use"""
+    conn = sqlite3.connect(Path(db_path).resolve().as_uri() + "?mode=ro", uri=True, check_same_thread=False)
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn, threading.Lock()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_all(db_path: str, db_mtime: float) -> dict:
+    """Read the dashboard tables once per database version; treat the result as read-only"""
+    conn, lock = _get_conn(db_path)
+    with lock:
+        return {
+            "top_crimes": pd.read_sql_query(TOP_CRIMES_QUERY, conn)
+        }
+
+# Fixed display tables, keyed by name; built into DataFrames once by _static_table
+STATIC_TABLES = {
+    "roadmap": {
+        "Phase": ["Phase 0", "Phase 1", "Phase 2", "Phase 3"],
+        "Duration": ["3 months", "6 months", "12 months", "6 months"],
+        "Target": ["Pilot (3 cities)", "Scale (5 cities)", "National (9 provinces)", "Full ecosystem"],
+        "Budget": ["R2.5M", "R5M", "R10M", "R15M"],
+        "Expected Impact": ["30% improvement", "40% improvement", "45% improvement", "50% improvement"]
+    },
+    "police_activity": {
+        "Time": ["14:32", "14:28", "14:15", "14:10", "14:05"],
+        "Event": ["ANPR Alert - Stolen Vehicle", "Gunshot Detected", "Weapon Detected", "CIT Alert", "Fraud Alert"],
+        "Location": ["Sandton CBD", "Hillbrow", "Soweto", "R21 Highway", "Online"],
+        "Status": ["Active", "Resolved", "Active", "Resolved", "Investigation"]
+    },
+    "threat_points": {
+        "lat": [-26.2041, -33.9249, -29.8587, -25.7479, -26.2041],
+        "lon": [28.0473, 18.4241, 31.0218, 28.2293, 28.0473],
+        "threat_type": ["ANPR Alert", "Gunshot", "Weapon", "CIT", "Fraud"],
+        "severity": [8, 9, 7, 10, 6],
+        "location": ["Sandton", "Cape Town", "Durban", "Pretoria", "Johannesburg"]
+    },
+    "threat_correlations": {
+        "Cyber Event": ["SIM Swap", "Card Fraud", "Phishing", "Identity Theft"],
+        "Physical Event": ["Phone Theft", "Card Theft", "Document Theft", "Vehicle Theft"],
+        "Correlation Score": [0.95, 0.87, 0.82, 0.78],
+        "Time Window": ["2 hours", "4 hours", "6 hours", "12 hours"]
+    },
+    "police_alerts": {
+        "Alert ID": ["ALT-001", "ALT-002", "ALT-003", "ALT-004"],
+        "Type": ["ANPR", "Gunshot", "Weapon", "CIT"],
+        "Severity": ["High", "Critical", "Medium", "Critical"],
+        "Location": ["Sandton CBD", "Hillbrow", "Soweto", "R21 Highway"],
+        "Time": ["14:32", "14:28", "14:15", "14:10"],
+        "Status": ["Active", "Active", "Investigation", "Active"]
+    },
+    "police_cases": {
+        "Case ID": ["CASE-001", "CASE-002", "CASE-003", "CASE-004"],
+        "Type": ["Vehicle Theft", "Armed Robbery", "CIT Robbery", "Fraud"],
+        "Status": ["Open", "Investigation", "Closed", "Open"],
+        "Assigned To": ["Officer Smith", "Officer Johnson", "Officer Brown", "Officer Davis"],
+        "Created": ["2025-01-15", "2025-01-14", "2025-01-13", "2025-01-12"],
+        "Priority": ["High", "Critical", "High", "Medium"]
+    },
+    "security_operations": {
+        "Operation": ["CBD Patrol", "Residential Security", "Event Security", "CIT Escort"],
+        "Location": ["Sandton", "Bryanston", "Convention Centre", "R21 Highway"],
+        "Units": [4, 2, 6, 3],
+        "Status": ["Active", "Active", "Active", "Active"],
+        "ETA": ["On-site", "5 min", "On-site", "12 min"]
+    },
+    "security_alerts": {
+        "Alert ID": ["SEC-001", "SEC-002", "SEC-003", "SEC-004"],
+        "Type": ["Perimeter Breach", "Suspicious Activity", "Vehicle Alert", "Emergency"],
+        "Location": ["Client Site A", "Client Site B", "Client Site C", "Client Site D"],
+        "Severity": ["Medium", "High", "Low", "Critical"],
+        "Time": ["14:30", "14:25", "14:20", "14:15"],
+        "Action": ["Investigate", "Dispatch Unit", "Monitor", "Emergency Response"]
+    },
+    "security_personnel": {
+        "Officer": ["Smith, J.", "Johnson, M.", "Brown, K.", "Davis, L.", "Wilson, R."],
+        "Status": ["On Duty", "On Duty", "Break", "On Duty", "Off Duty"],
+        "Location": ["CBD Patrol", "Residential", "Base", "Event Security", "Home"],
+        "Hours Worked": [8.5, 7.2, 6.8, 9.1, 0],
+        "Performance": ["Excellent", "Good", "Good", "Excellent", "N/A"]
+    },
+    "security_response_times": {
+        "Location": ["Sandton", "Bryanston", "Midrand", "Fourways"],
+        "Avg Response": [2.8, 3.2, 4.1, 3.5]
+    },
+    "insurance_risk_areas": {
+        "Area": ["Hillbrow", "Soweto", "Alexandra", "Tembisa", "Khayelitsha"],
+        "Risk Score": [9.2, 8.8, 8.5, 8.1, 7.9],
+        "Claims (30d)": [45, 38, 32, 28, 25],
+        "Trend": ["↑", "↑", "→", "↓", "→"]
+    },
+    "insurance_fraud_alerts": {
+        "Alert ID": ["FRAUD-001", "FRAUD-002", "FRAUD-003", "FRAUD-004"],
+        "Type": ["Duplicate Claim", "Suspicious Activity", "False Information", "Staged Accident"],
+        "Policy": ["POL-12345", "POL-12346", "POL-12347", "POL-12348"],
+        "Amount": ["R45,000", "R78,000", "R23,000", "R156,000"],
+        "Confidence": ["95%", "87%", "92%", "89%"],
+        "Status": ["Investigation", "Rejected", "Investigation", "Pending"]
+    },
+    "insurance_claims": {
+        "Claim ID": ["CLM-001", "CLM-002", "CLM-003", "CLM-004"],
+        "Type": ["Vehicle Theft", "Property Damage", "Personal Injury", "Fraud"],
+        "Amount": ["R85,000", "R45,000", "R120,000", "R0"],
+        "Status": ["Approved", "Pending", "Investigation", "Rejected"],
+        "Date": ["2025-01-15", "2025-01-14", "2025-01-13", "2025-01-12"],
+        "Risk Score": ["6.2", "7.8", "5.1", "9.5"]
+    },
+    "bank_risk_transactions": {
+        "Transaction ID": ["TXN-001", "TXN-002", "TXN-003", "TXN-004"],
+        "Type": ["Card Fraud", "SIM Swap", "Phishing", "Account Takeover"],
+        "Amount": ["R25,000", "R45,000", "R12,000", "R78,000"],
+        "Risk Score": ["9.2", "8.8", "7.5", "9.5"],
+        "Status": ["Blocked", "Blocked", "Investigation", "Blocked"],
+        "Time": ["14:30", "14:25", "14:20", "14:15"]
+    },
+    "bank_fraud_alerts": {
+        "Alert ID": ["FRAUD-001", "FRAUD-002", "FRAUD-003", "FRAUD-004"],
+        "Type": ["Card Cloning", "SIM Swap", "Phishing", "Account Takeover"],
+        "Account": ["ACC-12345", "ACC-12346", "ACC-12347", "ACC-12348"],
+        "Amount": ["R15,000", "R25,000", "R8,000", "R45,000"],
+        "Confidence": ["96%", "94%", "89%", "97%"],
+        "Action": ["Block Card", "Freeze Account", "Investigate", "Block Account"]
+    },
+    "bank_transactions": {
+        "Transaction ID": ["TXN-001", "TXN-002", "TXN-003", "TXN-004"],
+        "Account": ["ACC-12345", "ACC-12346", "ACC-12347", "ACC-12348"],
+        "Type": ["Card Payment", "Transfer", "Withdrawal", "Online Payment"],
+        "Amount": ["R1,500", "R5,000", "R2,000", "R3,500"],
+        "Location": ["Sandton", "Online", "ATM", "Online"],
+        "Risk Score": ["2.1", "6.8", "4.2", "7.5"],
+        "Status": ["Approved", "Pending", "Approved", "Investigation"]
+    }
+}
+
+@st.cache_resource(show_spinner=False)
+def _static_table(name: str) -> pd.DataFrame:
+    """Build one of the fixed display tables once per process; shared, so callers must not mutate it"""
+    return pd.DataFrame(STATIC_TABLES[name])
+
+@st.cache_resource(show_spinner=False)
+def _report_days() -> np.ndarray:
+    """Daily x-axis shared by the police and bank trend charts"""
+    return pd.date_range(start='2025-01-01', end='2025-01-15', freq='D').to_numpy()
+
+# Figures are cached as shared objects: st.plotly_chart serialises them without
+# modifying them, so one build per process (or per data version) serves every rerun.
+# plotly.express is imported inside the builders; it is the slow part of plotly's
+# import and nothing outside them needs it.
+@st.cache_resource(show_spinner=False)
+def _top_crimes_fig(top_crimes: pd.DataFrame) -> go.Figure:
+    """Top crime categories bar chart, rebuilt only when the data changes"""
+    import plotly.express as px
+    fig = px.bar(
+        top_crimes,
+        x='subcategory',
+        y='total',
+        title='Top 10 Crime Categories (SAPS 2023/24)',
+        color='total',
+        color_continuous_scale='Reds'
+    )
+    fig.update_layout(xaxis_tickangle=-45)
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def _threat_map_fig() -> go.Figure:
+    """Police threat map, built straight from the point arrays"""
+    points = _static_table("threat_points")
+    severity = points["severity"].to_numpy()
+    hover = ("<b>" + points["threat_type"] + "</b><br>location=" + points["location"]
+             + "<br>severity=" + points["severity"].astype(str)).to_numpy()
+    
+    fig = go.Figure(go.Scattermapbox(
+        lat=points["lat"].to_numpy(),
+        lon=points["lon"].to_numpy(),
+        mode="markers",
+        # Area-scaled with the same sizeref px derives from size_max=20
+        marker=dict(size=severity, sizemode="area", sizeref=severity.max() / 20 ** 2,
+                    color=severity, colorscale="Reds", showscale=True,
+                    colorbar=dict(title="severity")),
+        text=hover,
+        hoverinfo="text"
+    ))
+    
+    fig.update_layout(
+        mapbox_style="open-street-map",
+        mapbox_zoom=5,
+        mapbox_center={"lat": -30.0, "lon": 25.0},
+        uirevision="threat",
+        title="South Africa Threat Map",
+        height=600
+    )
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def _police_response_fig() -> go.Figure:
+    """Police response time trend"""
+    import plotly.express as px
+    # Simulate response time data
+    response_times = np.array([5.2, 4.8, 4.5, 4.2, 3.9, 3.7, 3.5, 3.3, 3.1, 2.9, 2.7, 2.5, 2.3, 2.1, 2.0])
+    
+    return px.line(
+        x=_report_days(),
+        y=response_times,
+        title="Average Response Time (minutes)",
+        labels={'x': 'Date', 'y': 'Response Time (min)'}
+    )
+
+@st.cache_resource(show_spinner=False)
+def _police_crime_types_fig() -> go.Figure:
+    """Police crime type distribution"""
+    import plotly.express as px
+    crime_types = ['Vehicle Theft', 'Armed Robbery', 'CIT Robbery', 'Fraud', 'Other']
+    crime_counts = [45, 32, 18, 28, 15]
+    
+    return px.pie(
+        values=crime_counts,
+        names=crime_types,
+        title="Crime Types (Last 30 Days)"
+    )
+
+@st.cache_resource(show_spinner=False)
+def _security_response_fig() -> go.Figure:
+    """Private security response time by location"""
+    import plotly.express as px
+    return px.bar(
+        _static_table("security_response_times"),
+        x="Location",
+        y="Avg Response",
+        title="Average Response Time (minutes)"
+    )
+
+@st.cache_resource(show_spinner=False)
+def _security_incidents_fig() -> go.Figure:
+    """Private security incident type distribution"""
+    import plotly.express as px
+    incident_types = ['Theft', 'Vandalism', 'Trespassing', 'Disturbance', 'Other']
+    incident_counts = [25, 18, 12, 8, 5]
+    
+    return px.pie(
+        values=incident_counts,
+        names=incident_types,
+        title="Incident Types (Last 30 Days)"
+    )
+
+@st.cache_resource(show_spinner=False)
+def _insurance_claims_fig() -> go.Figure:
+    """Insurance claim amounts by type"""
+    import plotly.express as px
+    claim_types = ['Vehicle', 'Property', 'Personal', 'Fraud']
+    claim_amounts = [2500000, 1800000, 1200000, 0]
+    
+    return px.bar(
+        x=claim_types,
+        y=claim_amounts,
+        title="Claims Amount by Type (R)"
+    )
+
+@st.cache_resource(show_spinner=False)
+def _insurance_risk_fig() -> go.Figure:
+    """Insurance policy risk score distribution"""
+    import plotly.express as px
+    risk_scores = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    policy_counts = [120, 180, 250, 320, 450, 380, 290, 180, 95, 45]
+    
+    return px.histogram(
+        x=risk_scores,
+        y=policy_counts,
+        title="Policy Risk Score Distribution"
+    )
+
+@st.cache_resource(show_spinner=False)
+def _bank_fraud_types_fig() -> go.Figure:
+    """Bank fraud type distribution"""
+    import plotly.express as px
+    fraud_types = ['Card Fraud', 'SIM Swap', 'Phishing', 'Account Takeover', 'Other']
+    fraud_counts = [45, 32, 28, 18, 12]
+    
+    return px.pie(
+        values=fraud_counts,
+        names=fraud_types,
+        title="Fraud Types (Last 30 Days)"
+    )
+
+@st.cache_resource(show_spinner=False)
+def _bank_volume_fig() -> go.Figure:
+    """Bank daily transaction volume"""
+    import plotly.express as px
+    volumes = np.array([12000, 13500, 12800, 14200, 13800, 15100, 14500, 13200, 13900, 14600, 14100, 13800, 14400, 14700, 15000], dtype=np.int32)
+    
+    return px.line(
+        x=_report_days(),
+        y=volumes,
+        title="Daily Transaction Volume"
+    )
+
+# Each role dashboard is a title, a tagline and its tabs; a tab is rendered in
+# the order header, markdown, metrics, chart, table, figures, or handed to a
+# fragment method when it carries interactive widgets
+_ROLE_CONFIGS = {
+    "Police Officer": {
+        "title": "👮 Police Officer Dashboard",
+        "tagline": "### Real-Time Crime Detection & Threat Intelligence",
+        "tabs": (
+            ("📊 Overview", {
+                "header": "📊 System Overview",
+                "metrics": (
+                    ("Active Alerts", "23", "↑ 5 from yesterday"),
+                    ("Response Time", "2.3 min", "↓ 45% improvement"),
+                    ("Cases Resolved", "156", "↑ 12 this week"),
+                    ("System Uptime", "99.9%", "Last 30 days"),
+                ),
+                "table": ("🕐 Recent Activity", "police_activity"),
+            }),
+            ("🗺️ Threat Map", {
+                "header": "🗺️ Threat Intelligence Map",
+                "markdown": "### Real-Time Threat Visualization",
+                "chart": _threat_map_fig,
+                "table": ("🔗 Threat Correlations", "threat_correlations"),
+            }),
+            ("🚨 Active Alerts", {"fragment": "_police_alerts"}),
+            ("📋 Cases", {"fragment": "_police_cases"}),
+            ("📈 Analytics", {
+                "header": "📈 Analytics & Reports",
+                "figures": (
+                    ("Response Time Trends", _police_response_fig),
+                    ("Crime Type Distribution", _police_crime_types_fig),
+                ),
+            }),
+        ),
+    },
+    "Private Security": {
+        "title": "🔒 Private Security Dashboard",
+        "tagline": "### Enhanced Security Operations & Intelligence",
+        "tabs": (
+            ("📊 Operations", {
+                "header": "📊 Operations Overview",
+                "metrics": (
+                    ("Active Units", "24", "↑ 2 from yesterday"),
+                    ("Response Time", "3.2 min", "↓ 30% improvement"),
+                    ("Incidents Handled", "89", "↑ 15 this week"),
+                    ("Client Satisfaction", "94%", "↑ 2% this month"),
+                ),
+                "table": ("🎯 Active Operations", "security_operations"),
+            }),
+            ("🚨 Alerts", {
+                "header": "🚨 Security Alerts",
+                "table": (None, "security_alerts"),
+            }),
+            ("👥 Personnel", {
+                "header": "👥 Personnel Management",
+                "table": (None, "security_personnel"),
+            }),
+            ("📈 Performance", {
+                "header": "📈 Performance Analytics",
+                "figures": (
+                    ("Response Time by Location", _security_response_fig),
+                    ("Incident Types", _security_incidents_fig),
+                ),
+            }),
+        ),
+    },
+    "Insurance Agent": {
+        "title": "🏦 Insurance Agent Dashboard",
+        "tagline": "### Risk Assessment & Fraud Prevention",
+        "tabs": (
+            ("📊 Risk Overview", {
+                "header": "📊 Risk Overview",
+                "metrics": (
+                    ("Active Policies", "12,456", "↑ 234 this month"),
+                    ("Risk Score", "7.2/10", "↓ 0.3 from last month"),
+                    ("Fraud Detected", "23", "↑ 5 this week"),
+                    ("Claims Saved", "R2.3M", "↑ R500K this month"),
+                ),
+                "table": ("🚨 High-Risk Areas", "insurance_risk_areas"),
+            }),
+            ("🚨 Fraud Alerts", {
+                "header": "🚨 Fraud Detection Alerts",
+                "table": (None, "insurance_fraud_alerts"),
+            }),
+            ("📋 Claims", {
+                "header": "📋 Claims Management",
+                "table": (None, "insurance_claims"),
+            }),
+            ("📈 Analytics", {
+                "header": "📈 Analytics & Reports",
+                "figures": (
+                    ("Claims by Type", _insurance_claims_fig),
+                    ("Risk Score Distribution", _insurance_risk_fig),
+                ),
+            }),
+        ),
+    },
+    "Bank Representative": {
+        "title": "🏛️ Bank Representative Dashboard",
+        "tagline": "### Financial Crime Prevention & Risk Management",
+        "tabs": (
+            ("📊 Risk Overview", {
+                "header": "📊 Risk Overview",
+                "metrics": (
+                    ("Active Accounts", "2.3M", "↑ 45K this month"),
+                    ("Fraud Prevention", "98.5%", "↑ 0.2% this month"),
+                    ("Suspicious Activity", "156", "↓ 23 this week"),
+                    ("Losses Prevented", "R15.2M", "↑ R2.1M this month"),
+                ),
+                "table": ("🚨 High-Risk Transactions", "bank_risk_transactions"),
+            }),
+            ("🚨 Fraud Alerts", {
+                "header": "🚨 Fraud Detection Alerts",
+                "table": (None, "bank_fraud_alerts"),
+            }),
+            ("💳 Transactions", {
+                "header": "💳 Transaction Monitoring",
+                "table": (None, "bank_transactions"),
+            }),
+            ("📈 Analytics", {
+                "header": "📈 Analytics & Reports",
+                "figures": (
+                    ("Fraud Types", _bank_fraud_types_fig),
+                    ("Transaction Volume", _bank_volume_fig),
+                ),
+            }),
+        ),
+    },
+}
+
+@st.cache_resource(show_spinner=False)
+def _auth_table():
+    """Per-process key and keyed digests of the role passwords, compared in constant time"""
+    passwords = {
+        "Police Officer": "police123",
+        "Private Security": "security123", 
+        "Insurance Agent": "insurance123",
+        "Bank Representative": "bank123"
+    }
+    
+    key = secrets.token_bytes(32)
+    digests = {role: hashlib.blake2b(password.encode(), key=key).digest() for role, password in passwords.items()}
+    return key, MappingProxyType(digests)
+
 class SentinelWebApp:
     def __init__(self):
         self.db_path = Path("real_data/sentinel_integrated.db")
-        self.real_data_path = Path("real_data/sentinel_real_data.json")
         
     def load_data(self):
-        """Load data from database and JSON files"""
+        """Load data from the integrated database"""
         try:
-            # Load real data
-            with open(self.real_data_path, 'r') as f:
-                self.real_data = json.load(f)
+            # Cached across reruns; the database mtime invalidates it when the data changes.
+            # In WAL mode recent commits touch the -wal file before the database itself
+            wal_path = self.db_path.with_name(self.db_path.name + "-wal")
+            mtime = self.db_path.stat().st_mtime
+            if wal_path.exists():
+                mtime = max(mtime, wal_path.stat().st_mtime)
+            
+            data = _load_all(str(self.db_path), mtime)
             
-            # Load database data
-            conn = sqlite3.connect(self.db_path)
-            self.crime_stats = pd.read_sql_query("SELECT * FROM crime_statistics", conn)
-            self.vehicle_crimes = pd.read_sql_query("SELECT * FROM vehicle_crimes", conn)
-            self.cit_incidents = pd.read_sql_query("SELECT * FROM cit_incidents", conn)
-            self.cyber_fraud = pd.read_sql_query("SELECT * FROM cyber_fraud", conn)
-            self.recommendations = pd.read_sql_query("SELECT * FROM sentinel_recommendations", conn)
-            conn.close()
+            self.top_crimes = data["top_crimes"]
             
             return True
         except Exception as e:
@@ -65,14 +512,10 @@ class SentinelWebApp:
             password = st.sidebar.text_input("Password", type="password")
             
             # Simple password check (in production, use proper authentication)
-            passwords = {
-                "Police Officer": "police123",
-                "Private Security": "security123", 
-                "Insurance Agent": "insurance123",
-                "Bank Representative": "bank123"
-            }
+            auth_key, password_digests = _auth_table()
+            digest = hashlib.blake2b(password.encode(), key=auth_key).digest()
             
-            if password == passwords.get(user_type):
+            if hmac.compare_digest(digest, password_digests.get(user_type, b"")):
                 return user_type
             elif password:
                 st.sidebar.error("Invalid password")
@@ -171,32 +614,15 @@ class SentinelWebApp:
         # Key statistics
         st.header("📈 Key Statistics")
         
-        if hasattr(self, 'crime_stats'):
+        if hasattr(self, 'top_crimes'):
             # Crime statistics visualization
-            fig = px.bar(
-                self.crime_stats.head(10),
-                x='subcategory',
-                y='total',
-                title='Top 10 Crime Categories (SAPS 2023/24)',
-                color='total',
-                color_continuous_scale='Reds'
-            )
-            fig.update_layout(xaxis_tickangle=-45)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(_top_crimes_fig(self.top_crimes), use_container_width=True)
         
         # Deployment roadmap
         st.header("🚀 Deployment Roadmap")
         
-        roadmap_data = {
-            "Phase": ["Phase 0", "Phase 1", "Phase 2", "Phase 3"],
-            "Duration": ["3 months", "6 months", "12 months", "6 months"],
-            "Target": ["Pilot (3 cities)", "Scale (5 cities)", "National (9 provinces)", "Full ecosystem"],
-            "Budget": ["R2.5M", "R5M", "R10M", "R15M"],
-            "Expected Impact": ["30% improvement", "40% improvement", "45% improvement", "50% improvement"]
-        }
-        
-        roadmap_df = pd.DataFrame(roadmap_data)
-        st.dataframe(roadmap_df, use_container_width=True)
+        roadmap_df = _static_table("roadmap")
+        st.table(roadmap_df)
         
         # Contact information
         st.header("📞 Contact Information")
@@ -215,523 +641,98 @@ class SentinelWebApp:
             st.subheader("📱 Phone")
             st.markdown("+27 11 123 4567")
     
-    def render_police_dashboard(self):
-        """Render police officer dashboard with threat map access"""
-        st.title("👮 Police Officer Dashboard")
-        st.markdown("### Real-Time Crime Detection & Threat Intelligence")
+    @st.fragment
+    def _police_alerts(self):
+        """Police alerts tab; its action buttons rerun only this fragment"""
+        st.header("🚨 Active Alerts")
         
-        # Navigation tabs
-        tab1, tab2, tab3, tab4, tab5 = st.tabs([
-            "📊 Overview", "🗺️ Threat Map", "🚨 Active Alerts", "📋 Cases", "📈 Analytics"
-        ])
+        # Alert management
+        alert_df = _static_table("police_alerts")
+        st.table(alert_df)
         
-        with tab1:
-            st.header("📊 System Overview")
-            
-            # Key metrics
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric("Active Alerts", "23", "↑ 5 from yesterday")
-            
-            with col2:
-                st.metric("Response Time", "2.3 min", "↓ 45% improvement")
-            
-            with col3:
-                st.metric("Cases Resolved", "156", "↑ 12 this week")
-            
-            with col4:
-                st.metric("System Uptime", "99.9%", "Last 30 days")
-            
-            # Recent activity
-            st.subheader("🕐 Recent Activity")
-            
-            activity_data = {
-                "Time": ["14:32", "14:28", "14:15", "14:10", "14:05"],
-                "Event": ["ANPR Alert - Stolen Vehicle", "Gunshot Detected", "Weapon Detected", "CIT Alert", "Fraud Alert"],
-                "Location": ["Sandton CBD", "Hillbrow", "Soweto", "R21 Highway", "Online"],
-                "Status": ["Active", "Resolved", "Active", "Resolved", "Investigation"]
-            }
-            
-            activity_df = pd.DataFrame(activity_data)
-            st.dataframe(activity_df, use_container_width=True)
+        # Alert actions
+        st.subheader("🎯 Alert Actions")
         
-        with tab2:
-            st.header("🗺️ Threat Intelligence Map")
-            
-            # Threat map component (integrated from our previous work)
-            st.markdown("### Real-Time Threat Visualization")
-            
-            # Simulate threat data
-            threat_data = {
-                "lat": [-26.2041, -33.9249, -29.8587, -25.7479, -26.2041],
-                "lon": [28.0473, 18.4241, 31.0218, 28.2293, 28.0473],
-                "threat_type": ["ANPR Alert", "Gunshot", "Weapon", "CIT", "Fraud"],
-                "severity": [8, 9, 7, 10, 6],
-                "location": ["Sandton", "Cape Town", "Durban", "Pretoria", "Johannesburg"]
-            }
-            
-            threat_df = pd.DataFrame(threat_data)
-            
-            # Create map
-            fig = px.scatter_mapbox(
-                threat_df,
-                lat="lat",
-                lon="lon",
-                color="severity",
-                size="severity",
-                hover_name="threat_type",
-                hover_data=["location", "severity"],
-                color_continuous_scale="Reds",
-                size_max=20,
-                zoom=5,
-                center={"lat": -30.0, "lon": 25.0}
-            )
-            
-            fig.update_layout(
-                mapbox_style="open-street-map",
-                title="South Africa Threat Map",
-                height=600
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Threat correlation
-            st.subheader("🔗 Threat Correlations")
-            
-            correlation_data = {
-                "Cyber Event": ["SIM Swap", "Card Fraud", "Phishing", "Identity Theft"],
-                "Physical Event": ["Phone Theft", "Card Theft", "Document Theft", "Vehicle Theft"],
-                "Correlation Score": [0.95, 0.87, 0.82, 0.78],
-                "Time Window": ["2 hours", "4 hours", "6 hours", "12 hours"]
-            }
-            
-            correlation_df = pd.DataFrame(correlation_data)
-            st.dataframe(correlation_df, use_container_width=True)
+        col1, col2, col3 = st.columns(3)
         
-        with tab3:
-            st.header("🚨 Active Alerts")
-            
-            # Alert management
-            alert_data = {
-                "Alert ID": ["ALT-001", "ALT-002", "ALT-003", "ALT-004"],
-                "Type": ["ANPR", "Gunshot", "Weapon", "CIT"],
-                "Severity": ["High", "Critical", "Medium", "Critical"],
-                "Location": ["Sandton CBD", "Hillbrow", "Soweto", "R21 Highway"],
-                "Time": ["14:32", "14:28", "14:15", "14:10"],
-                "Status": ["Active", "Active", "Investigation", "Active"]
-            }
-            
-            alert_df = pd.DataFrame(alert_data)
-            st.dataframe(alert_df, use_container_width=True)
-            
-            # Alert actions
-            st.subheader("🎯 Alert Actions")
-            
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                if st.button("🚔 Dispatch Unit", key="dispatch"):
-                    st.success("Unit dispatched to location")
-            
-            with col2:
-                if st.button("📞 Contact Security", key="contact"):
-                    st.success("Private security contacted")
-            
-            with col3:
-                if st.button("📋 Create Case", key="case"):
-                    st.success("Case created and assigned")
+        with col1:
+            if st.button("🚔 Dispatch Unit", key="dispatch"):
+                st.success("Unit dispatched to location")
         
-        with tab4:
-            st.header("📋 Case Management")
-            
-            # Case list
-            case_data = {
-                "Case ID": ["CASE-001", "CASE-002", "CASE-003", "CASE-004"],
-                "Type": ["Vehicle Theft", "Armed Robbery", "CIT Robbery", "Fraud"],
-                "Status": ["Open", "Investigation", "Closed", "Open"],
-                "Assigned To": ["Officer Smith", "Officer Johnson", "Officer Brown", "Officer Davis"],
-                "Created": ["2025-01-15", "2025-01-14", "2025-01-13", "2025-01-12"],
-                "Priority": ["High", "Critical", "High", "Medium"]
-            }
-            
-            case_df = pd.DataFrame(case_data)
-            st.dataframe(case_df, use_container_width=True)
-            
-            # Case details
-            st.subheader("📝 Case Details")
-            
-            selected_case = st.selectbox("Select Case", case_df["Case ID"])
-            
-            if selected_case:
-                st.markdown(f"""
-                **Case ID:** {selected_case}
-                **Type:** Vehicle Theft
-                **Status:** Open
-                **Assigned To:** Officer Smith
-                **Created:** 2025-01-15
-                **Priority:** High
-                
-                **Description:** Stolen vehicle detected via ANPR system. Vehicle last seen in Sandton CBD.
-                **Evidence:** ANPR capture, CCTV footage, witness statements
-                **Updates:** Investigation ongoing, suspect vehicle tracked
-                """)
+        with col2:
+            if st.button("📞 Contact Security", key="contact"):
+                st.success("Private security contacted")
         
-        with tab5:
-            st.header("📈 Analytics & Reports")
-            
-            # Performance metrics
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("Response Time Trends")
-                
-                # Simulate response time data
-                dates = pd.date_range(start='2025-01-01', end='2025-01-15', freq='D')
-                response_times = [5.2, 4.8, 4.5, 4.2, 3.9, 3.7, 3.5, 3.3, 3.1, 2.9, 2.7, 2.5, 2.3, 2.1, 2.0]
-                
-                fig = px.line(
-                    x=dates,
-                    y=response_times,
-                    title="Average Response Time (minutes)",
-                    labels={'x': 'Date', 'y': 'Response Time (min)'}
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col2:
-                st.subheader("Crime Type Distribution")
-                
-                crime_types = ['Vehicle Theft', 'Armed Robbery', 'CIT Robbery', 'Fraud', 'Other']
-                crime_counts = [45, 32, 18, 28, 15]
-                
-                fig = px.pie(
-                    values=crime_counts,
-                    names=crime_types,
-                    title="Crime Types (Last 30 Days)"
-                )
-                st.plotly_chart(fig, use_container_width=True)
+        with col3:
+            if st.button("📋 Create Case", key="case"):
+                st.success("Case created and assigned")
     
-    def render_private_security_dashboard(self):
-        """Render private security dashboard"""
-        st.title("🔒 Private Security Dashboard")
-        st.markdown("### Enhanced Security Operations & Intelligence")
-        
-        # Navigation tabs
-        tab1, tab2, tab3, tab4 = st.tabs([
-            "📊 Operations", "🚨 Alerts", "👥 Personnel", "📈 Performance"
-        ])
-        
-        with tab1:
-            st.header("📊 Operations Overview")
-            
-            # Key metrics
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric("Active Units", "24", "↑ 2 from yesterday")
-            
-            with col2:
-                st.metric("Response Time", "3.2 min", "↓ 30% improvement")
-            
-            with col3:
-                st.metric("Incidents Handled", "89", "↑ 15 this week")
-            
-            with col4:
-                st.metric("Client Satisfaction", "94%", "↑ 2% this month")
-            
-            # Active operations
-            st.subheader("🎯 Active Operations")
-            
-            operations_data = {
-                "Operation": ["CBD Patrol", "Residential Security", "Event Security", "CIT Escort"],
-                "Location": ["Sandton", "Bryanston", "Convention Centre", "R21 Highway"],
-                "Units": [4, 2, 6, 3],
-                "Status": ["Active", "Active", "Active", "Active"],
-                "ETA": ["On-site", "5 min", "On-site", "12 min"]
-            }
-            
-            operations_df = pd.DataFrame(operations_data)
-            st.dataframe(operations_df, use_container_width=True)
-        
-        with tab2:
-            st.header("🚨 Security Alerts")
-            
-            # Alert types specific to private security
-            alert_data = {
-                "Alert ID": ["SEC-001", "SEC-002", "SEC-003", "SEC-004"],
-                "Type": ["Perimeter Breach", "Suspicious Activity", "Vehicle Alert", "Emergency"],
-                "Location": ["Client Site A", "Client Site B", "Client Site C", "Client Site D"],
-                "Severity": ["Medium", "High", "Low", "Critical"],
-                "Time": ["14:30", "14:25", "14:20", "14:15"],
-                "Action": ["Investigate", "Dispatch Unit", "Monitor", "Emergency Response"]
-            }
-            
-            alert_df = pd.DataFrame(alert_data)
-            st.dataframe(alert_df, use_container_width=True)
-        
-        with tab3:
-            st.header("👥 Personnel Management")
-            
-            # Personnel status
-            personnel_data = {
-                "Officer": ["Smith, J.", "Johnson, M.", "Brown, K.", "Davis, L.", "Wilson, R."],
-                "Status": ["On Duty", "On Duty", "Break", "On Duty", "Off Duty"],
-                "Location": ["CBD Patrol", "Residential", "Base", "Event Security", "Home"],
-                "Hours Worked": [8.5, 7.2, 6.8, 9.1, 0],
-                "Performance": ["Excellent", "Good", "Good", "Excellent", "N/A"]
-            }
-            
-            personnel_df = pd.DataFrame(personnel_data)
-            st.dataframe(personnel_df, use_container_width=True)
-        
-        with tab4:
-            st.header("📈 Performance Analytics")
-            
-            # Performance metrics
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("Response Time by Location")
-                
-                location_data = {
-                    "Location": ["Sandton", "Bryanston", "Midrand", "Fourways"],
-                    "Avg Response": [2.8, 3.2, 4.1, 3.5]
-                }
-                
-                location_df = pd.DataFrame(location_data)
-                fig = px.bar(
-                    location_df,
-                    x="Location",
-                    y="Avg Response",
-                    title="Average Response Time (minutes)"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col2:
-                st.subheader("Incident Types")
-                
-                incident_types = ['Theft', 'Vandalism', 'Trespassing', 'Disturbance', 'Other']
-                incident_counts = [25, 18, 12, 8, 5]
-                
-                fig = px.pie(
-                    values=incident_counts,
-                    names=incident_types,
-                    title="Incident Types (Last 30 Days)"
-                )
-                st.plotly_chart(fig, use_container_width=True)
+    @st.fragment
+    def _police_cases(self):
+        """Police case tab; picking a case reruns only this fragment"""
+        st.header("📋 Case Management")
+        
+        # Case list
+        case_df = _static_table("police_cases")
+        st.table(case_df)
+        
+        # Case details
+        st.subheader("📝 Case Details")
+        
+        selected_case = st.selectbox("Select Case", case_df["Case ID"])
+        
+        if selected_case:
+            st.markdown(f"""
+            **Case ID:** {selected_case}
+            **Type:** Vehicle Theft
+            **Status:** Open
+            **Assigned To:** Officer Smith
+            **Created:** 2025-01-15
+            **Priority:** High
+        
+            **Description:** Stolen vehicle detected via ANPR system. Vehicle last seen in Sandton CBD.
+            **Evidence:** ANPR capture, CCTV footage, witness statements
+            **Updates:** Investigation ongoing, suspect vehicle tracked
+            """)
     
-    def render_insurance_dashboard(self):
-        """Render insurance agent dashboard"""
-        st.title("🏦 Insurance Agent Dashboard")
-        st.markdown("### Risk Assessment & Fraud Prevention")
+    def _render_role_dashboard(self, config):
+        """Render a role dashboard from its _ROLE_CONFIGS entry"""
+        st.title(config["title"])
+        st.markdown(config["tagline"])
         
         # Navigation tabs
-        tab1, tab2, tab3, tab4 = st.tabs([
-            "📊 Risk Overview", "🚨 Fraud Alerts", "📋 Claims", "📈 Analytics"
-        ])
-        
-        with tab1:
-            st.header("📊 Risk Overview")
-            
-            # Key metrics
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric("Active Policies", "12,456", "↑ 234 this month")
-            
-            with col2:
-                st.metric("Risk Score", "7.2/10", "↓ 0.3 from last month")
-            
-            with col3:
-                st.metric("Fraud Detected", "23", "↑ 5 this week")
-            
-            with col4:
-                st.metric("Claims Saved", "R2.3M", "↑ R500K this month")
-            
-            # High-risk areas
-            st.subheader("🚨 High-Risk Areas")
-            
-            risk_data = {
-                "Area": ["Hillbrow", "Soweto", "Alexandra", "Tembisa", "Khayelitsha"],
-                "Risk Score": [9.2, 8.8, 8.5, 8.1, 7.9],
-                "Claims (30d)": [45, 38, 32, 28, 25],
-                "Trend": ["↑", "↑", "→", "↓", "→"]
-            }
-            
-            risk_df = pd.DataFrame(risk_data)
-            st.dataframe(risk_df, use_container_width=True)
-        
-        with tab2:
-            st.header("🚨 Fraud Detection Alerts")
-            
-            # Fraud alerts
-            fraud_data = {
-                "Alert ID": ["FRAUD-001", "FRAUD-002", "FRAUD-003", "FRAUD-004"],
-                "Type": ["Duplicate Claim", "Suspicious Activity", "False Information", "Staged Accident"],
-                "Policy": ["POL-12345", "POL-12346", "POL-12347", "POL-12348"],
-                "Amount": ["R45,000", "R78,000", "R23,000", "R156,000"],
-                "Confidence": ["95%", "87%", "92%", "89%"],
-                "Status": ["Investigation", "Rejected", "Investigation", "Pending"]
-            }
-            
-            fraud_df = pd.DataFrame(fraud_data)
-            st.dataframe(fraud_df, use_container_width=True)
-        
-        with tab3:
-            st.header("📋 Claims Management")
-            
-            # Claims data
-            claims_data = {
-                "Claim ID": ["CLM-001", "CLM-002", "CLM-003", "CLM-004"],
-                "Type": ["Vehicle Theft", "Property Damage", "Personal Injury", "Fraud"],
-                "Amount": ["R85,000", "R45,000", "R120,000", "R0"],
-                "Status": ["Approved", "Pending", "Investigation", "Rejected"],
-                "Date": ["2025-01-15", "2025-01-14", "2025-01-13", "2025-01-12"],
-                "Risk Score": ["6.2", "7.8", "5.1", "9.5"]
-            }
-            
-            claims_df = pd.DataFrame(claims_data)
-            st.dataframe(claims_df, use_container_width=True)
+        labels, tabs = zip(*config["tabs"])
         
-        with tab4:
-            st.header("📈 Analytics & Reports")
-            
-            # Analytics
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("Claims by Type")
-                
-                claim_types = ['Vehicle', 'Property', 'Personal', 'Fraud']
-                claim_amounts = [2500000, 1800000, 1200000, 0]
-                
-                fig = px.bar(
-                    x=claim_types,
-                    y=claim_amounts,
-                    title="Claims Amount by Type (R)"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col2:
-                st.subheader("Risk Score Distribution")
+        for container, tab in zip(st.tabs(list(labels)), tabs):
+            with container:
+                if "fragment" in tab:
+                    getattr(self, tab["fragment"])()
+                    continue
                 
-                risk_scores = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-                policy_counts = [120, 180, 250, 320, 450, 380, 290, 180, 95, 45]
+                st.header(tab["header"])
                 
-                fig = px.histogram(
-                    x=risk_scores,
-                    y=policy_counts,
-                    title="Policy Risk Score Distribution"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-    
-    def render_bank_dashboard(self):
-        """Render bank representative dashboard"""
-        st.title("🏛️ Bank Representative Dashboard")
-        st.markdown("### Financial Crime Prevention & Risk Management")
-        
-        # Navigation tabs
-        tab1, tab2, tab3, tab4 = st.tabs([
-            "📊 Risk Overview", "🚨 Fraud Alerts", "💳 Transactions", "📈 Analytics"
-        ])
-        
-        with tab1:
-            st.header("📊 Risk Overview")
-            
-            # Key metrics
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric("Active Accounts", "2.3M", "↑ 45K this month")
-            
-            with col2:
-                st.metric("Fraud Prevention", "98.5%", "↑ 0.2% this month")
-            
-            with col3:
-                st.metric("Suspicious Activity", "156", "↓ 23 this week")
-            
-            with col4:
-                st.metric("Losses Prevented", "R15.2M", "↑ R2.1M this month")
-            
-            # High-risk transactions
-            st.subheader("🚨 High-Risk Transactions")
-            
-            transaction_data = {
-                "Transaction ID": ["TXN-001", "TXN-002", "TXN-003", "TXN-004"],
-                "Type": ["Card Fraud", "SIM Swap", "Phishing", "Account Takeover"],
-                "Amount": ["R25,000", "R45,000", "R12,000", "R78,000"],
-                "Risk Score": ["9.2", "8.8", "7.5", "9.5"],
-                "Status": ["Blocked", "Blocked", "Investigation", "Blocked"],
-                "Time": ["14:30", "14:25", "14:20", "14:15"]
-            }
-            
-            transaction_df = pd.DataFrame(transaction_data)
-            st.dataframe(transaction_df, use_container_width=True)
-        
-        with tab2:
-            st.header("🚨 Fraud Detection Alerts")
-            
-            # Fraud alerts
-            fraud_data = {
-                "Alert ID": ["FRAUD-001", "FRAUD-002", "FRAUD-003", "FRAUD-004"],
-                "Type": ["Card Cloning", "SIM Swap", "Phishing", "Account Takeover"],
-                "Account": ["ACC-12345", "ACC-12346", "ACC-12347", "ACC-12348"],
-                "Amount": ["R15,000", "R25,000", "R8,000", "R45,000"],
-                "Confidence": ["96%", "94%", "89%", "97%"],
-                "Action": ["Block Card", "Freeze Account", "Investigate", "Block Account"]
-            }
-            
-            fraud_df = pd.DataFrame(fraud_data)
-            st.dataframe(fraud_df, use_container_width=True)
-        
-        with tab3:
-            st.header("💳 Transaction Monitoring")
-            
-            # Transaction data
-            transaction_data = {
-                "Transaction ID": ["TXN-001", "TXN-002", "TXN-003", "TXN-004"],
-                "Account": ["ACC-12345", "ACC-12346", "ACC-12347", "ACC-12348"],
-                "Type": ["Card Payment", "Transfer", "Withdrawal", "Online Payment"],
-                "Amount": ["R1,500", "R5,000", "R2,000", "R3,500"],
-                "Location": ["Sandton", "Online", "ATM", "Online"],
-                "Risk Score": ["2.1", "6.8", "4.2", "7.5"],
-                "Status": ["Approved", "Pending", "Approved", "Investigation"]
-            }
-            
-            transaction_df = pd.DataFrame(transaction_data)
-            st.dataframe(transaction_df, use_container_width=True)
-        
-        with tab4:
-            st.header("📈 Analytics & Reports")
-            
-            # Analytics
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("Fraud Types")
+                if "markdown" in tab:
+                    st.markdown(tab["markdown"])
                 
-                fraud_types = ['Card Fraud', 'SIM Swap', 'Phishing', 'Account Takeover', 'Other']
-                fraud_counts = [45, 32, 28, 18, 12]
+                if "metrics" in tab:
+                    for col, (label, value, delta) in zip(st.columns(len(tab["metrics"])), tab["metrics"]):
+                        with col:
+                            st.metric(label, value, delta)
                 
-                fig = px.pie(
-                    values=fraud_counts,
-                    names=fraud_types,
-                    title="Fraud Types (Last 30 Days)"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col2:
-                st.subheader("Transaction Volume")
+                if "chart" in tab:
+                    st.plotly_chart(tab["chart"](), use_container_width=True)
                 
-                dates = pd.date_range(start='2025-01-01', end='2025-01-15', freq='D')
-                volumes = [12000, 13500, 12800, 14200, 13800, 15100, 14500, 13200, 13900, 14600, 14100, 13800, 14400, 14700, 15000]
+                if "table" in tab:
+                    subheader, name = tab["table"]
+                    if subheader:
+                        st.subheader(subheader)
+                    st.table(_static_table(name))
                 
-                fig = px.line(
-                    x=dates,
-                    y=volumes,
-                    title="Daily Transaction Volume"
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                if "figures" in tab:
+                    for col, (subheader, build) in zip(st.columns(len(tab["figures"])), tab["figures"]):
+                        with col:
+                            st.subheader(subheader)
+                            st.plotly_chart(build(), use_container_width=True)
     
     def run(self):
         """Run the web application"""
@@ -749,14 +750,8 @@ class SentinelWebApp:
         # Render appropriate dashboard
         if user_type == "Public":
             self.render_public_showcase()
-        elif user_type == "Police Officer":
-            self.render_police_dashboard()
-        elif user_type == "Private Security":
-            self.render_private_security_dashboard()
-        elif user_type == "Insurance Agent":
-            self.render_insurance_dashboard()
-        elif user_type == "Bank Representative":
-            self.render_bank_dashboard()
+        else:
+            self._render_role_dashboard(_ROLE_CONFIGS[user_type])
 
 if __name__ == "__main__":
     app = SentinelWebApp()
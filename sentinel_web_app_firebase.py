@@ -415,7 +415,7 @@ class SentinelWebAppFirebase:
             st.header("📋 Case Management")
             
             # Get cases from Firebase
-            cases = self.firebase.get_cases_by_user(st.session_state.user_email, 'police')
+            cases, _ = self.firebase.get_cases_by_user(st.session_state.user_email, 'police')
             
             if cases:
                 case_data = []
@@ -0,0 +1,143 @@
+"""Tests for firebase_integration against an in-memory stand-in for Firestore queries"""
+
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("firebase_admin")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import firebase_integration
+from firebase_integration import FirebaseIntegration
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+    
+    def to_dict(self):
+        return dict(self._data)
+
+
+class FakeQuery:
+    """Orders by created_at DESC with the document id as tiebreaker, like Firestore"""
+    
+    def __init__(self, snapshots, page_size=None, after=None):
+        self.snapshots = snapshots
+        self.page_size = page_size
+        self.after = after
+    
+    def collection(self, name):
+        return self
+    
+    def where(self, field, op, value):
+        return type(self)([s for s in self.snapshots if s.to_dict().get(field) == value], self.page_size, self.after)
+    
+    def order_by(self, field, direction=None):
+        return self
+    
+    def limit(self, page_size):
+        return FakeQuery(self.snapshots, page_size, self.after)
+    
+    def start_after(self, snapshot):
+        assert isinstance(snapshot, FakeSnapshot), "cursor must be a DocumentSnapshot"
+        return FakeQuery(self.snapshots, self.page_size, snapshot)
+    
+    def stream(self):
+        key = lambda s: (s.to_dict()['created_at'], s.id)
+        ordered = sorted(self.snapshots, key=key, reverse=True)
+        if self.after is not None:
+            ordered = [s for s in ordered if key(s) < key(self.after)]
+        return iter(ordered[:self.page_size])
+
+
+def test_get_cases_by_user_pages_through_equal_created_at():
+    # One batch commit stamps every case with the same server timestamp
+    cases = [FakeSnapshot(f"CASE-{i:03d}", {'case_id': f"CASE-{i:03d}", 'assigned_to': 'agent', 'created_at': 1000})
+             for i in range(25)]
+    firebase = FirebaseIntegration()
+    firebase.db = FakeQuery(cases)
+    firebase.initialized = True
+    
+    seen, cursor = [], None
+    while True:
+        page, cursor = firebase.get_cases_by_user('agent', 'insurance', page_size=10, cursor=cursor)
+        seen.extend(case['case_id'] for case in page)
+        if cursor is None:
+            break
+    
+    assert sorted(seen) == sorted(s.id for s in cases)
+    assert len(seen) == len(set(seen))
+
+
+class FakeWriteDB:
+    """Records the updates committed through write batches"""
+    
+    def __init__(self):
+        self.updates = {}
+    
+    def collection(self, name):
+        return self
+    
+    def document(self, doc_id):
+        return doc_id
+    
+    def batch(self):
+        return self
+    
+    def update(self, doc_id, fields):
+        self.updates[doc_id] = fields
+    
+    def commit(self, retry=None):
+        pass
+
+
+def test_backfill_alert_visibility_only_touches_alerts_without_it():
+    alerts = [
+        FakeSnapshot('ALERT-001', {'type': 'Fraud'}),
+        FakeSnapshot('ALERT-002', {'type': 'Gunshot'}),
+        FakeSnapshot('ALERT-003', {'type': 'security', 'visible_to': ['private_security']}),
+    ]
+    firebase = FirebaseIntegration()
+    firebase.db = FakeQuery(alerts)
+    firebase.db.select = lambda field_paths: firebase.db
+    firebase.db.stream = lambda: iter(alerts)
+    firebase.write_db = FakeWriteDB()
+    firebase.initialized = True
+    
+    assert firebase.backfill_alert_visibility()
+    assert firebase.write_db.updates == {
+        'ALERT-001': {'visible_to': ['insurance', 'bank']},
+        'ALERT-002': {'visible_to': []},
+    }
+
+
+class FakeUsers(FakeQuery):
+    """users collection where email lookups return the matching snapshots"""
+    
+    def limit(self, page_size):
+        return self
+    
+    def get(self):
+        return list(self.snapshots)
+
+
+def test_get_user_by_email_evicts_oldest_and_returns_copies(monkeypatch):
+    monkeypatch.setattr(firebase_integration, 'USER_CACHE_MAXSIZE', 2)
+    firebase = FirebaseIntegration()
+    firebase.db = FakeUsers([FakeSnapshot(f"uid-{i}", {'uid': f"uid-{i}", 'email': f"user{i}@example.com"})
+                             for i in range(3)])
+    firebase.initialized = True
+    
+    for i in range(3):
+        firebase.get_user_by_email(f"user{i}@example.com")
+    
+    # Only the oldest entry made room for the third user
+    assert list(firebase._user_cache) == ['user1@example.com', 'user2@example.com']
+    
+    user = firebase.get_user_by_email('user2@example.com')
+    user['role'] = 'tampered'
+    assert 'role' not in firebase.get_user_by_email('user2@example.com')
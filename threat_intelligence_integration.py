@@ -386,8 +386,12 @@ class SentinelThreatIntelligence:
         
         correlations = []
         
-        for _, cyber_threat in cyber_threats.iterrows():
-            for _, physical_event in physical_evidence.iterrows():
+        # Plain dict rows: no per-row Series, and the inner side is built once
+        # rather than re-iterated for every cyber threat
+        physical_events = physical_evidence.to_dict('records')
+        
+        for cyber_threat in cyber_threats.to_dict('records'):
+            for physical_event in physical_events:
                 correlation_score = self.calculate_correlation_score(cyber_threat, physical_event)
                 
                 if correlation_score > 0.5:  # Threshold for significant correlation
@@ -416,7 +420,7 @@ class SentinelThreatIntelligence:
         logger.info(f"Found {len(correlations)} cyber-physical correlations")
         return correlations
 
-    def calculate_correlation_score(self, cyber_threat: pd.Series, physical_event: pd.Series) -> float:
+    def calculate_correlation_score(self, cyber_threat: Dict[str, Any], physical_event: Dict[str, Any]) -> float:
         """Calculate correlation score between cyber and physical events"""
         score = 0.0
         
@@ -464,7 +468,7 @@ class SentinelThreatIntelligence:
         r = 6371  # Earth's radius in kilometers
         return c * r
 
-    def determine_correlation_type(self, cyber_threat: pd.Series, physical_event: pd.Series) -> str:
+    def determine_correlation_type(self, cyber_threat: Dict[str, Any], physical_event: Dict[str, Any]) -> str:
         """Determine the type of correlation between cyber and physical events"""
         cyber_type = cyber_threat.get("threat_type", "")
         physical_type = physical_event.get("kind", "")
@@ -478,7 +482,7 @@ class SentinelThreatIntelligence:
         else:
             return "general_correlation"
 
-    def generate_evidence_links(self, cyber_threat: pd.Series, physical_event: pd.Series) -> List[str]:
+    def generate_evidence_links(self, cyber_threat: Dict[str, Any], physical_event: Dict[str, Any]) -> List[str]:
         """Generate evidence links between cyber and physical events"""
         links = []
         